@@ -1,11 +1,48 @@
 """ARM metadata parser for extracting architecture information."""
 
 import json
+import mmap
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import ijson
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from .isa_database import AddressingModeRecord, ArchitectureRecord, RegisterRecord
 
+# Default AArch64 register table as
+# (name, register_class, width_bits, encoding_id, is_main_register) rows
+_DEFAULT_AARCH64_REGISTER_ROWS: Tuple[
+    Tuple[str, str, int, Optional[int], bool], ...
+] = (
+    # General Purpose Registers X0-X30
+    *((f"X{i}", "gpr", 64, i, True) for i in range(31)),
+    # 32-bit variants W0-W30
+    *((f"W{i}", "gpr", 32, i, False) for i in range(31)),
+    # Stack Pointer
+    ("SP", "gpr", 64, 31, True),
+    # Zero Register
+    ("XZR", "gpr", 64, 31, True),
+    ("WZR", "gpr", 32, 31, False),
+    # Vector Registers V0-V31
+    *((f"V{i}", "simd", 128, i, True) for i in range(32)),
+    # Scalar floating-point variants: double, single, half precision and byte
+    *(
+        (f"{prefix}{i}", "simd", width, i, False)
+        for i in range(32)
+        for prefix, width in (("D", 64), ("S", 32), ("H", 16), ("B", 8))
+    ),
+    # Program Counter
+    ("PC", "control", 64, None, True),
+    # Processor State Register
+    ("PSTATE", "flags", 32, None, True),
+)
+
 
 class ARMMetadataParser:
     """Parser for ARM machine-readable JSON files to extract architecture metadata."""
@@ -16,15 +53,15 @@ class ARMMetadataParser:
         self.registers_file = self.arm_dir / "Registers.json"
         self.features_file = self.arm_dir / "Features.json"
 
-    def get_version_info(self) -> Optional[str]:
-        """Get ARM architecture version from metadata."""
+    @cached_property
+    def _version_info(self) -> Optional[str]:
+        """ARM architecture version, read from Instructions.json once."""
         try:
             if self.instructions_file.exists():
-                with open(self.instructions_file, "r") as f:
-                    # Only read the first part of the file to get metadata
-                    data = json.load(f)
-                    meta = data.get("_meta", {})
-                    version = meta.get("version", {})
+                with open(self.instructions_file, "rb") as f:
+                    # Stream only the _meta.version object instead of parsing
+                    # the whole instruction catalog
+                    version = next(ijson.items(f, "_meta.version"), {})
                     arch_version = version.get("architecture", "")
                     build = version.get("build", "")
                     ref = version.get("ref", "")
@@ -33,6 +70,30 @@ class ARMMetadataParser:
             pass
         return None
 
+    @cached_property
+    def _features_data(self) -> Optional[Any]:
+        """Decoded Features.json contents, or None if missing or unreadable."""
+        if not self.features_file.exists():
+            return None
+
+        try:
+            # Map the file so orjson decodes straight from the page cache
+            # instead of an intermediate read() buffer
+            with (
+                open(self.features_file, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                if orjson:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+                return json.loads(mm[:])
+        except Exception:
+            return None
+
+    def get_version_info(self) -> Optional[str]:
+        """Get ARM architecture version from metadata."""
+        return self._version_info
+
     def parse_architectures(self) -> List[ArchitectureRecord]:
         """Parse architecture metadata for AArch64."""
         architectures = []
@@ -49,245 +110,98 @@ class ARMMetadataParser:
 
         return architectures
 
-    def parse_registers(self) -> List[RegisterRecord]:
+    def parse_registers(self, architecture_id: int = 1) -> List[RegisterRecord]:
         """Parse registers from Registers.json for AArch64."""
-        aarch64_registers = []
-
-        if not self.registers_file.exists():
-            # Fallback to predefined register list
-            return self._get_default_aarch64_registers()
-
-        try:
-            with open(self.registers_file, "r") as f:
-                json.load(f)
-
-            # The registers file contains system registers, but we need GPRs
-            # for now, use predefined list and extract system registers if needed
-            aarch64_registers = self._get_default_aarch64_registers()
-
-            # TODO: Extract system registers from JSON data
-            # This would require parsing the complex register structure
-
-        except Exception:
-            # Fall back to predefined registers
-            aarch64_registers = self._get_default_aarch64_registers()
-
-        return aarch64_registers
-
-    def _get_default_aarch64_registers(self) -> List[RegisterRecord]:
+        # The registers file contains system registers, but we need GPRs
+        # for now, so use the predefined list without reading the file
+        # TODO: Extract system registers from Registers.json
+        # This would require parsing the complex register structure
+        return self._get_default_aarch64_registers(architecture_id)
+
+    def _get_default_aarch64_registers(
+        self, architecture_id: int = 1
+    ) -> List[RegisterRecord]:
         """Get default AArch64 register definitions."""
-        registers = []
-        register_id = 1
-
-        # General Purpose Registers X0-X30
-        for i in range(31):
-            registers.append(
-                RegisterRecord(
-                    architecture_id=1,  # Will be set properly when inserting
-                    register_name=f"X{i}",
-                    register_class="gpr",
-                    width_bits=64,
-                    encoding_id=i,
-                    is_main_register=True,
-                )
-            )
-            register_id += 1
-
-        # 32-bit variants W0-W30
-        for i in range(31):
-            registers.append(
-                RegisterRecord(
-                    architecture_id=1,
-                    register_name=f"W{i}",
-                    register_class="gpr",
-                    width_bits=32,
-                    encoding_id=i,
-                    is_main_register=False,
-                )
-            )
-            register_id += 1
-
-        # Stack Pointer
-        registers.append(
+        return [
             RegisterRecord(
-                architecture_id=1,
-                register_name="SP",
-                register_class="gpr",
-                width_bits=64,
-                encoding_id=31,
-                is_main_register=True,
+                architecture_id=architecture_id,
+                register_name=name,
+                register_class=register_class,
+                width_bits=width_bits,
+                encoding_id=encoding_id,
+                is_main_register=is_main_register,
             )
-        )
-
-        # Zero Register
-        registers.append(
-            RegisterRecord(
-                architecture_id=1,
-                register_name="XZR",
-                register_class="gpr",
-                width_bits=64,
-                encoding_id=31,
-                is_main_register=True,
-            )
-        )
-
-        registers.append(
-            RegisterRecord(
-                architecture_id=1,
-                register_name="WZR",
-                register_class="gpr",
-                width_bits=32,
-                encoding_id=31,
-                is_main_register=False,
-            )
-        )
-
-        # Vector Registers V0-V31
-        for i in range(32):
-            registers.append(
-                RegisterRecord(
-                    architecture_id=1,
-                    register_name=f"V{i}",
-                    register_class="simd",
-                    width_bits=128,
-                    encoding_id=i,
-                    is_main_register=True,
-                )
-            )
-
-        # Scalar floating-point variants
-        for i in range(32):
-            # 64-bit double precision
-            registers.append(
-                RegisterRecord(
-                    architecture_id=1,
-                    register_name=f"D{i}",
-                    register_class="simd",
-                    width_bits=64,
-                    encoding_id=i,
-                    is_main_register=False,
-                )
-            )
-            # 32-bit single precision
-            registers.append(
-                RegisterRecord(
-                    architecture_id=1,
-                    register_name=f"S{i}",
-                    register_class="simd",
-                    width_bits=32,
-                    encoding_id=i,
-                    is_main_register=False,
-                )
-            )
-            # 16-bit half precision
-            registers.append(
-                RegisterRecord(
-                    architecture_id=1,
-                    register_name=f"H{i}",
-                    register_class="simd",
-                    width_bits=16,
-                    encoding_id=i,
-                    is_main_register=False,
-                )
-            )
-            # 8-bit byte
-            registers.append(
-                RegisterRecord(
-                    architecture_id=1,
-                    register_name=f"B{i}",
-                    register_class="simd",
-                    width_bits=8,
-                    encoding_id=i,
-                    is_main_register=False,
-                )
-            )
-
-        # Program Counter
-        registers.append(
-            RegisterRecord(
-                architecture_id=1,
-                register_name="PC",
-                register_class="control",
-                width_bits=64,
-                encoding_id=None,
-                is_main_register=True,
-            )
-        )
-
-        # Processor State Register
-        registers.append(
-            RegisterRecord(
-                architecture_id=1,
-                register_name="PSTATE",
-                register_class="flags",
-                width_bits=32,
-                encoding_id=None,
-                is_main_register=True,
-            )
-        )
-
-        return registers
+            for (
+                name,
+                register_class,
+                width_bits,
+                encoding_id,
+                is_main_register,
+            ) in _DEFAULT_AARCH64_REGISTER_ROWS
+        ]
 
-    def parse_addressing_modes(self) -> List[AddressingModeRecord]:
+    def parse_addressing_modes(
+        self, architecture_id: int = 1
+    ) -> List[AddressingModeRecord]:
         """Parse addressing modes for AArch64."""
         # AArch64 addressing modes
         aarch64_modes = [
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=architecture_id,
                 mode_name="register_direct",
                 description="Direct register addressing",
                 example_syntax="MOV X0, X1",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=architecture_id,
                 mode_name="immediate",
                 description="Immediate addressing",
                 example_syntax="MOV X0, #42",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=architecture_id,
                 mode_name="base_register",
                 description="Base register addressing",
                 example_syntax="LDR X0, [X1]",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=architecture_id,
                 mode_name="base_offset",
                 description="Base plus offset addressing",
                 example_syntax="LDR X0, [X1, #8]",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=architecture_id,
                 mode_name="pre_indexed",
                 description="Pre-indexed addressing",
                 example_syntax="LDR X0, [X1, #8]!",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=architecture_id,
                 mode_name="post_indexed",
                 description="Post-indexed addressing",
                 example_syntax="LDR X0, [X1], #8",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=architecture_id,
                 mode_name="register_offset",
                 description="Base plus register offset",
                 example_syntax="LDR X0, [X1, X2]",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=architecture_id,
                 mode_name="scaled_register_offset",
                 description="Base plus scaled register offset",
                 example_syntax="LDR X0, [X1, X2, LSL #3]",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=architecture_id,
                 mode_name="pc_relative",
                 description="PC-relative addressing",
                 example_syntax="ADR X0, label",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=architecture_id,
                 mode_name="literal",
                 description="Literal pool addressing",
                 example_syntax="LDR X0, =value",
@@ -300,13 +214,11 @@ class ARMMetadataParser:
         """Parse CPU features from Features.json."""
         features = {}
 
-        if not self.features_file.exists():
+        data = self._features_data
+        if data is None:
             return {"aarch64": ["BASE"]}
 
         try:
-            with open(self.features_file, "r") as f:
-                data = json.load(f)
-
             # Extract feature names
             feature_list = []
             if "features" in data:
@@ -1,7 +1,8 @@
 """ARM importer for AArch64 instruction data."""
 
+import logging
 from pathlib import Path
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Dict, Optional
 
 from ..arm_metadata_parser import ARMMetadataParser
 from ..isa_database import InstructionRecord
@@ -12,15 +13,14 @@ from .base import ISAImporter
 class ARMImporter(ISAImporter):
     """Importer for ARM AArch64 instruction data."""
 
+    isa_name = "aarch64"
+
     def __init__(self, db):
         super().__init__(db)
         self.parser = ARMInstructionParser()
         self._version = "1.0.0"
         self._arch_metadata_populated = False
-
-    @property
-    def isa_name(self) -> str:
-        return "aarch64"
+        self._metadata_parsers: Dict[Path, ARMMetadataParser] = {}
 
     @property
     def importer_version(self) -> str:
@@ -29,11 +29,18 @@ class ARMImporter(ISAImporter):
     def get_source_version(self, source_dir: Path) -> Optional[str]:
         """Get ARM documentation version from source directory."""
         try:
-            metadata_parser = ARMMetadataParser(source_dir)
-            return metadata_parser.get_version_info()
+            return self._get_metadata_parser(source_dir).get_version_info()
         except Exception:
             return None
 
+    def _get_metadata_parser(self, source_dir: Path) -> ARMMetadataParser:
+        """Return the metadata parser for a source directory, creating it once."""
+        parser = self._metadata_parsers.get(source_dir)
+        if parser is None:
+            parser = ARMMetadataParser(source_dir)
+            self._metadata_parsers[source_dir] = parser
+        return parser
+
     async def parse_sources(
         self, source_dir: Path
     ) -> AsyncGenerator[InstructionRecord, None]:
@@ -55,52 +62,51 @@ class ARMImporter(ISAImporter):
     ) -> AsyncGenerator[InstructionRecord, None]:
         """Process the ARM Instructions.json file."""
         try:
-            for instruction_record in self.parser.parse_instructions_file(file_path):
-                try:
+            records = self.parser.parse_instructions_file(file_path)
+            async for chunk in self._chunked_in_thread(records):
+                for instruction_record in chunk:
                     yield instruction_record
-                except Exception as e:
-                    self.log_error(f"Error processing instruction: {e}")
         except Exception as e:
             self.log_error(f"Error parsing instructions file {file_path}: {e}")
 
+        if self.parser.parse_errors:
+            self.log_warning(
+                f"Skipped {self.parser.parse_errors} ARM instruction entries "
+                "that failed to parse"
+            )
+
     async def populate_architecture_metadata(self, source_dir: Path) -> bool:
         """Populate architecture metadata from ARM data files."""
         try:
             self.logger.info("Populating ARM architecture metadata...")
 
-            # Create ARMMetadataParser instance
-            parser = ARMMetadataParser(source_dir)
+            # Reuse the metadata parser (and its cached file reads) from
+            # get_source_version
+            parser = self._get_metadata_parser(source_dir)
 
             # Parse architecture specifications
             architectures = parser.parse_architectures()
 
+            # Insert architectures first so their IDs can be assigned while
+            # registers and addressing modes are constructed
+            arch_ids = self.db.insert_architectures(architectures)
+            self.logger.info(f"Inserted {len(arch_ids)} architectures")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for isa_name, arch_id in arch_ids.items():
+                    self.logger.debug(
+                        "Inserted architecture: %s (ID: %d)", isa_name, arch_id
+                    )
+
             # Parse registers
-            aarch64_registers = parser.parse_registers()
+            aarch64_registers = parser.parse_registers(arch_ids["aarch64"])
 
             # Parse addressing modes
-            aarch64_modes = parser.parse_addressing_modes()
-
-            # Insert architectures
-            arch_ids = {}
-            for arch in architectures:
-                arch_id = self.db.insert_architecture(arch)
-                arch_ids[arch.isa_name] = arch_id
-                self.logger.info(
-                    f"Inserted architecture: {arch.isa_name} (ID: {arch_id})"
-                )
-
-            # Insert registers
-            for reg in aarch64_registers:
-                reg.architecture_id = arch_ids["aarch64"]
-                self.db.insert_register(reg)
+            aarch64_modes = parser.parse_addressing_modes(arch_ids["aarch64"])
 
-            self.logger.info(f"Inserted {len(aarch64_registers)} aarch64 registers")
-
-            # Insert addressing modes
-            for mode in aarch64_modes:
-                mode.architecture_id = arch_ids["aarch64"]
-                self.db.insert_addressing_mode(mode)
+            # Insert registers and addressing modes in one transaction
+            self.db.insert_architecture_metadata(aarch64_registers, aarch64_modes)
 
+            self.logger.info(f"Inserted {len(aarch64_registers)} aarch64 registers")
             self.logger.info(f"Inserted {len(aarch64_modes)} aarch64 addressing modes")
 
             self._arch_metadata_populated = True
@@ -1,132 +1,170 @@
 """ARM instruction parser for processing machine-readable instruction data."""
 
-import json
+import mmap
+import os
 import re
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional
+from types import MappingProxyType
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping, Optional
+
+import ijson
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from ..isa_database import EncodingRecord, InstructionRecord, OperandRecord
 
+_INSTRUCTION_TYPE = "Instruction.Instruction"
+_CONTAINER_TYPES = frozenset(
+    {"Instruction.InstructionSet", "Instruction.InstructionGroup"}
+)
+
+# Mapping from ARM feature names to simplified categories, shared read-only
+# by all parser instances
+_FEATURE_MAPPING: Mapping[str, str] = MappingProxyType(
+    {
+        "FEAT_FP": "FP",
+        "FEAT_ASIMD": "NEON",
+        "FEAT_AES": "AES",
+        "FEAT_SHA1": "SHA1",
+        "FEAT_SHA256": "SHA256",
+        "FEAT_CRC32": "CRC32",
+        "FEAT_LSE": "LSE",
+        "FEAT_FP16": "FP16",
+        "FEAT_DPB": "DPB",
+        "FEAT_SVE": "SVE",
+        "FEAT_SVE2": "SVE2",
+        "FEAT_TME": "TME",
+        "FEAT_BF16": "BF16",
+        "FEAT_I8MM": "I8MM",
+        "FEAT_MTE": "MTE",
+        "FEAT_PAUTH": "PAUTH",
+        "FEAT_FCMA": "FCMA",
+        "FEAT_JSCVT": "JSCVT",
+        "FEAT_LRCPC": "LRCPC",
+        "FEAT_LRCPC2": "LRCPC2",
+        "FEAT_FRINTTS": "FRINTTS",
+        "FEAT_DGH": "DGH",
+        "FEAT_RNG": "RNG",
+        "FEAT_FLAGM": "FLAGM",
+        "FEAT_FLAGM2": "FLAGM2",
+        "FEAT_FHML": "FHML",
+        "FEAT_ECV": "ECV",
+        "FEAT_AFP": "AFP",
+    }
+)
+
+# Instructions files up to this size are decoded whole with orjson when it is
+# installed; larger files are streamed with ijson to bound memory use
+_ORJSON_MAX_BYTES = 256 * 1024 * 1024
+
+_NAME_SUFFIX_RE = re.compile(r"_[A-Za-z0-9]+$")
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]")
+# str.translate table deleting every ASCII character except A-Z, a-z and 0-9
+_DROP_NON_ALNUM = {c: None for c in range(128) if not chr(c).isalnum()}
+# Syntax placeholder per operand type; other types are used verbatim
+_TYPE_TO_TOKEN = {"register": "reg", "memory": "mem", "immediate": "imm"}
+
 
 class ARMInstructionParser:
     """Parser for ARM machine-readable instruction data."""
 
     def __init__(self):
         self.instruction_cache = {}
-        self.feature_mapping = self._build_feature_mapping()
-
-    def _build_feature_mapping(self) -> Dict[str, str]:
-        """Build mapping from ARM feature names to simplified categories."""
-        return {
-            "FEAT_FP": "FP",
-            "FEAT_ASIMD": "NEON",
-            "FEAT_AES": "AES",
-            "FEAT_SHA1": "SHA1",
-            "FEAT_SHA256": "SHA256",
-            "FEAT_CRC32": "CRC32",
-            "FEAT_LSE": "LSE",
-            "FEAT_FP16": "FP16",
-            "FEAT_DPB": "DPB",
-            "FEAT_SVE": "SVE",
-            "FEAT_SVE2": "SVE2",
-            "FEAT_TME": "TME",
-            "FEAT_BF16": "BF16",
-            "FEAT_I8MM": "I8MM",
-            "FEAT_MTE": "MTE",
-            "FEAT_PAUTH": "PAUTH",
-            "FEAT_FCMA": "FCMA",
-            "FEAT_JSCVT": "JSCVT",
-            "FEAT_LRCPC": "LRCPC",
-            "FEAT_LRCPC2": "LRCPC2",
-            "FEAT_FRINTTS": "FRINTTS",
-            "FEAT_DGH": "DGH",
-            "FEAT_RNG": "RNG",
-            "FEAT_FLAGM": "FLAGM",
-            "FEAT_FLAGM2": "FLAGM2",
-            "FEAT_FHML": "FHML",
-            "FEAT_ECV": "ECV",
-            "FEAT_AFP": "AFP",
-        }
+        self.feature_mapping = _FEATURE_MAPPING
+        # Entries skipped because they failed to parse in the last file
+        self.parse_errors = 0
 
     def parse_instructions_file(
         self, instructions_file: Path
     ) -> Iterator[InstructionRecord]:
         """Parse the Instructions.json file and yield instruction records."""
+        self.parse_errors = 0
         if not instructions_file.exists():
             return
 
         try:
-            with open(instructions_file, "r") as f:
-                data = json.load(f)
-
-            # Handle the new array-based structure
-            instructions = data.get("instructions", [])
-            for instruction_obj in instructions:
-                try:
-                    # Recursively process instruction hierarchies
-                    for record in self._process_instruction_hierarchy(instruction_obj):
-                        yield record
-                except Exception:
-                    # Log error but continue processing
-                    continue
+            with open(instructions_file, "rb") as f:
+                for instruction_obj in self._iter_instruction_objects(f):
+                    try:
+                        # Recursively process instruction hierarchies
+                        yield from self._process_instruction_hierarchy(instruction_obj)
+                    except Exception:
+                        # Count the failure and continue processing
+                        self.parse_errors += 1
 
         except Exception:
             # Handle file reading errors
             return
 
+    def _iter_instruction_objects(self, f: BinaryIO) -> Iterator[Any]:
+        """Yield the top-level entries of the instructions array."""
+        if orjson and os.fstat(f.fileno()).st_size <= _ORJSON_MAX_BYTES:
+            # Small enough to decode in one pass with orjson, straight from
+            # a read-only mapping instead of an intermediate read() buffer
+            with (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                memoryview(mm) as view,
+            ):
+                data = orjson.loads(view)
+            yield from data.get("instructions", [])
+        else:
+            # Stream the array-based structure one top-level object at a
+            # time instead of materializing the whole file
+            yield from ijson.items(f, "instructions.item", use_float=True)
+
     def _process_instruction_hierarchy(self, obj: Dict) -> Iterator[InstructionRecord]:
-        """Recursively process instruction hierarchy to find actual instructions."""
-        if not isinstance(obj, dict):
-            return
+        """Walk an instruction hierarchy depth-first to find actual instructions."""
+        # Explicit stack instead of recursion; children are pushed in reverse
+        # so instructions are still yielded in document order
+        stack = [obj]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, dict):
+                continue
 
-        obj_type = obj.get("_type", "")
+            obj_type = node.get("_type", "")
 
-        if obj_type == "Instruction.Instruction":
-            # This is an actual instruction - parse it
-            name = obj.get("name", "UNKNOWN")
-            try:
-                records = self._parse_instruction(name, obj)
-                for record in records:
-                    yield record
-            except Exception:
-                # Continue processing other instructions
-                pass
+            if obj_type == _INSTRUCTION_TYPE:
+                # This is an actual instruction - parse it
+                name = node.get("name", "UNKNOWN")
+                try:
+                    yield from self._parse_instruction(name, node)
+                except Exception:
+                    # Count the failure and continue with other instructions
+                    self.parse_errors += 1
 
-        elif obj_type in ["Instruction.InstructionSet", "Instruction.InstructionGroup"]:
-            # This is a container - recurse into children
-            children = obj.get("children", [])
-            for child in children:
-                for record in self._process_instruction_hierarchy(child):
-                    yield record
+            elif obj_type in _CONTAINER_TYPES:
+                # This is a container - visit its children
+                stack.extend(reversed(node.get("children", ())))
 
     def _parse_instruction(
         self, name: str, instruction_data: Dict
     ) -> List[InstructionRecord]:
         """Parse a single instruction definition."""
-        records = []
-
-        # Handle different instruction types
+        # Handle different instruction types; each parser returns a fresh list
+        # that is handed back as-is instead of being copied
         instruction_type = instruction_data.get("_type", "")
 
         if instruction_type == "Instruction.Instruction":
-            records.extend(self._parse_base_instruction(name, instruction_data))
+            return self._parse_base_instruction(name, instruction_data)
         elif instruction_type == "Instruction.InstructionGroup":
-            records.extend(self._parse_instruction_group(name, instruction_data))
+            return self._parse_instruction_group(name, instruction_data)
         elif instruction_type == "Instruction.InstructionAlias":
-            records.extend(self._parse_instruction_alias(name, instruction_data))
+            return self._parse_instruction_alias(name, instruction_data)
 
-        return records
+        return []
 
     def _parse_base_instruction(
         self, name: str, instruction_data: Dict
     ) -> List[InstructionRecord]:
         """Parse a base instruction definition."""
-        records: List[InstructionRecord] = []
-
         # Extract basic information
         mnemonic = self._extract_mnemonic(name, instruction_data)
         if not mnemonic:
-            return records
+            return []
 
         description = self._extract_description(instruction_data)
         category = self._extract_category(instruction_data)
@@ -138,11 +176,11 @@ class ARMInstructionParser:
                 name, mnemonic, description, category, "default", instruction_data
             )
             if record:
-                records.append(record)
+                return [record]
         except Exception:
             pass
 
-        return records
+        return []
 
     def _parse_instruction_group(
         self, name: str, group_data: Dict
@@ -198,39 +236,45 @@ class ARMInstructionParser:
 
     def _extract_mnemonic(self, name: str, instruction_data: Dict) -> Optional[str]:
         """Extract instruction mnemonic from name and data."""
-        # Try to extract from assembly field first
-        assembly = instruction_data.get("assembly", {})
-        if (
-            isinstance(assembly, dict)
-            and assembly.get("_type") == "Instruction.Assembly"
-        ):
-            symbols = assembly.get("symbols", [])
-            if symbols and isinstance(symbols[0], dict):
-                first_symbol = symbols[0]
-                if first_symbol.get("_type") == "Instruction.Symbols.Literal":
+        # Try to extract from assembly field first. Well-formed entries take
+        # the direct lookups; any other shape falls through to the name
+        try:
+            assembly = instruction_data["assembly"]
+            if assembly["_type"] == "Instruction.Assembly":
+                first_symbol = assembly["symbols"][0]
+                if first_symbol["_type"] == "Instruction.Symbols.Literal":
                     return first_symbol.get("value", "").upper()
+        except (KeyError, IndexError, TypeError):
+            pass
 
         # Fallback: extract from instruction name
-        mnemonic = re.sub(r"_[A-Za-z0-9]+$", "", name)  # Remove suffix like _A1
-        mnemonic = re.sub(r"[^A-Za-z0-9]", "", mnemonic)  # Remove special characters
+        if name.isascii() and name.isalnum():
+            # Nothing to strip
+            return name.upper()
+        mnemonic = _NAME_SUFFIX_RE.sub("", name)  # Remove suffix like _A1
+        # Remove special characters
+        if mnemonic.isascii():
+            mnemonic = mnemonic.translate(_DROP_NON_ALNUM)
+        else:
+            mnemonic = _NON_ALNUM_RE.sub("", mnemonic)
         return mnemonic.upper() if mnemonic else None
 
     def _extract_description(self, instruction_data: Dict) -> str:
         """Extract instruction description."""
-        # Try to get title first (more descriptive)
-        title = instruction_data.get("title", "")
+        # Try to get title first (more descriptive, and present on most entries)
+        title = instruction_data.get("title")
         if title and isinstance(title, str):
             return title.strip()
 
-        # Try description object
-        description_obj = instruction_data.get("description", {})
-        if isinstance(description_obj, dict):
-            # Try to extract text from description object
-            after_text = description_obj.get("after", "")
-            before_text = description_obj.get("before", "")
-            text = after_text or before_text
+        # Try description object; only look up "before" when "after" is empty.
+        # Anything that is not a mapping of strings falls through
+        description_obj = instruction_data.get("description")
+        try:
+            text = description_obj.get("after") or description_obj.get("before")
             if text:
                 return text.strip()
+        except AttributeError:
+            pass
 
         # Fallback to basic description
         return "ARM AArch64 instruction"
@@ -295,21 +339,14 @@ class ARMInstructionParser:
 
     def _parse_operands(self, instance_data: Dict) -> List[OperandRecord]:
         """Parse operands from instance data."""
-        operands: List[OperandRecord] = []
-
         # This is a simplified operand parsing - the ARM data structure is very complex
-        # For now, create basic operand structure
-        # encodeset = instance_data.get('encodeset', {})
-
-        # Try to extract operand information from encoding
-        # This would need much more sophisticated parsing in practice
-
-        return operands
+        # and operand information would have to be extracted from the encoding.
+        # Until then every instruction gets an empty operand list
+        return []
 
     def _parse_encoding(self, instance_data: Dict) -> Optional[EncodingRecord]:
         """Parse encoding information from instance data."""
-        encoding = instance_data.get("encoding", {})
-
+        encoding = instance_data.get("encoding")
         if not encoding:
             return None
 
@@ -331,12 +368,9 @@ class ARMInstructionParser:
 
     def _extract_features(self, instance_data: Dict) -> List[str]:
         """Extract CPU features required for instruction."""
-        features = ["BASE"]
-
         # Look for feature requirements in the data
         # This would need more sophisticated parsing
-
-        return features
+        return ["BASE"]
 
     def _extract_flags_affected(self, instance_data: Dict) -> List[str]:
         """Extract flags affected by instruction."""
@@ -349,18 +383,8 @@ class ARMInstructionParser:
         if not operands:
             return mnemonic
 
-        operand_strings = []
-        for operand in operands:
-            if operand.type == "register":
-                operand_strings.append("reg")
-            elif operand.type == "memory":
-                operand_strings.append("mem")
-            elif operand.type == "immediate":
-                operand_strings.append("imm")
-            else:
-                operand_strings.append(operand.type)
-
-        return f"{mnemonic} {', '.join(operand_strings)}"
+        parts = [_TYPE_TO_TOKEN.get(op.type, op.type) for op in operands]
+        return mnemonic + " " + ", ".join(parts)
 
     def _generate_basic_syntax(self, mnemonic: str) -> str:
         """Generate basic syntax for aliases."""
@@ -1,10 +1,12 @@
 """Base importer framework for ISA instruction data."""
 
+import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
+from itertools import islice
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, Optional
+from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional, Tuple
 
 from ..isa_database import InstructionRecord, ISADatabase
 
@@ -12,6 +14,18 @@ from ..isa_database import InstructionRecord, ISADatabase
 class ISAImporter(ABC):
     """Base class for ISA importers."""
 
+    # Number of validated instructions written per database transaction
+    batch_size = 10_000
+    # Number of processed instructions between progress log lines
+    progress_interval = 1_000
+    # Number of parsed instructions handed to the import loop at a time
+    source_batch_size = 500
+    # Number of instruction records parsed per worker-thread hop
+    parse_chunk_size = 1000
+    # Importers without a parser yet set this so imports are recorded as
+    # skipped instead of walking sources that yield nothing
+    is_implemented = True
+
     def __init__(self, db: ISADatabase):
         self.db = db
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -25,7 +39,11 @@ class ISAImporter(ABC):
     @property
     @abstractmethod
     def isa_name(self) -> str:
-        """Return the ISA name this importer handles."""
+        """Return the ISA name this importer handles.
+
+        Subclasses override this with a plain class attribute so the registry
+        can read it without instantiating the importer.
+        """
         pass
 
     @property
@@ -41,6 +59,43 @@ class ISAImporter(ABC):
         """Parse source files and yield instruction records."""
         raise NotImplementedError
 
+    async def parse_source_batches(
+        self, source_dir: Path
+    ) -> AsyncGenerator[List[InstructionRecord], None]:
+        """Parse source files and yield lists of instruction records.
+
+        The default groups the output of parse_sources; importers that already
+        parse in chunks override this to hand each chunk over whole.
+        """
+        batch: List[InstructionRecord] = []
+        try:
+            async for instruction in self.parse_sources(source_dir):
+                batch.append(instruction)
+                if len(batch) >= self.source_batch_size:
+                    yield batch
+                    batch = []
+        except Exception:
+            # Hand over what was parsed before the failure
+            if batch:
+                yield batch
+            raise
+        if batch:
+            yield batch
+
+    async def _chunked_in_thread(
+        self, records: Iterator[InstructionRecord]
+    ) -> AsyncGenerator[List[InstructionRecord], None]:
+        """Drain a record iterator in chunks pulled on a worker thread."""
+        while True:
+            # Parse in chunks on a worker thread so CPU-bound parsing does not
+            # block other importers on the event loop
+            chunk = await asyncio.to_thread(
+                list, islice(records, self.parse_chunk_size)
+            )
+            if not chunk:
+                break
+            yield chunk
+
     @abstractmethod
     def get_source_version(self, source_dir: Path) -> Optional[str]:
         """Get version information from source files."""
@@ -64,6 +119,9 @@ class ISAImporter(ABC):
             "warnings": 0,
         }
 
+        if not self.is_implemented:
+            return self._skip_import(source_dir, start_time)
+
         try:
             source_version = self.get_source_version(source_dir)
 
@@ -77,32 +135,58 @@ class ISAImporter(ABC):
                         "continuing with instructions"
                     )
 
-            # Parse and insert instructions
-            async for instruction in self.parse_sources(source_dir):
-                try:
-                    self.stats["instructions_processed"] += 1
-
-                    # Validate instruction
-                    if not self._validate_instruction(instruction):
-                        self.stats["errors"] += 1
-                        continue
-
-                    # Insert into database
-                    self.db.insert_instruction(instruction)
-                    self.stats["instructions_inserted"] += 1
-
-                    # Progress logging
-                    if self.stats["instructions_processed"] % 100 == 0:
-                        self.logger.info(
-                            f"Processed {self.stats['instructions_processed']} "
-                            f"instructions ({self.stats['instructions_inserted']} "
-                            f"inserted, {self.stats['errors']} errors)"
-                        )
-
-                except Exception as e:
-                    self.logger.error(f"Error processing instruction: {e}")
-                    self.stats["errors"] += 1
-                    continue
+            # Parse instructions and insert them in batches. Full batches are
+            # written in a worker thread while parsing continues, with at most
+            # one batch in flight
+            batch: List[InstructionRecord] = []
+            pending: Optional[asyncio.Task] = None
+            # Count locally and publish to stats at each progress interval and
+            # once the loop ends
+            processed = 0
+            log_progress = self.logger.isEnabledFor(logging.INFO)
+            try:
+                async for parsed in self.parse_source_batches(source_dir):
+                    for instruction in parsed:
+                        processed += 1
+                        # Progress reporting, ahead of validation so skipped
+                        # instructions are counted too. Inserted rows are only
+                        # counted once their batch commits, so they lag behind
+                        if processed % self.progress_interval == 0:
+                            self.stats["instructions_processed"] = processed
+                            if log_progress:
+                                self.logger.info(
+                                    "Processed %d instructions "
+                                    "(%d committed, %d errors)",
+                                    processed,
+                                    self.stats["instructions_inserted"],
+                                    self.stats["errors"],
+                                )
+
+                        try:
+                            # Validate instruction
+                            if not self._validate_instruction(instruction):
+                                self.stats["errors"] += 1
+                                continue
+
+                            batch.append(instruction)
+                            if len(batch) >= self.batch_size:
+                                if pending is not None:
+                                    self._record_batch_counts(await pending)
+                                pending = asyncio.create_task(
+                                    asyncio.to_thread(self._insert_batch, batch)
+                                )
+                                batch = []
+
+                        except Exception as e:
+                            self.logger.error(f"Error processing instruction: {e}")
+                            self.stats["errors"] += 1
+                            continue
+            finally:
+                self.stats["instructions_processed"] = processed
+                # Flush what was parsed even if the source fails part way
+                if pending is not None:
+                    self._record_batch_counts(await pending)
+                self._record_batch_counts(self._insert_batch(batch))
 
             # Calculate duration
             duration = time.time() - start_time
@@ -161,25 +245,87 @@ class ISAImporter(ABC):
                 "error": error_msg,
             }
 
+    def _skip_import(self, source_dir: Path, start_time: float) -> Dict[str, Any]:
+        """Record and return a skipped import for an unimplemented importer."""
+        duration = time.time() - start_time
+        reason = f"{self.isa_name} importer not yet implemented"
+
+        self.logger.warning(f"Import skipped: {reason}")
+
+        self.db.record_import_metadata(
+            isa=self.isa_name,
+            source_path=str(source_dir),
+            instruction_count=0,
+            source_version=None,
+            importer_version=self.importer_version,
+            duration_seconds=duration,
+            success=True,
+            error_message=f"Skipped: {reason}",
+        )
+
+        return {
+            "success": True,
+            "skipped": True,
+            "duration_seconds": duration,
+            "stats": self.stats.copy(),
+            "reason": reason,
+        }
+
+    def _insert_batch(self, batch: List[InstructionRecord]) -> Tuple[int, int]:
+        """Insert a batch, isolating bad records if the batch fails.
+
+        Returns (inserted, failed) counts rather than updating stats, since
+        batches may be written from a worker thread.
+        """
+        if not batch:
+            return 0, 0
+
+        try:
+            return self.db.insert_instructions(batch), 0
+        except Exception as e:
+            self.logger.warning(f"Batch insert failed, retrying per instruction: {e}")
+
+        inserted = failed = 0
+        for instruction in batch:
+            try:
+                self.db.insert_instruction(instruction)
+                inserted += 1
+            except Exception as e:
+                self.logger.error(f"Error processing instruction: {e}")
+                failed += 1
+        return inserted, failed
+
+    def _record_batch_counts(self, counts: Tuple[int, int]):
+        """Add the (inserted, failed) counts of a written batch to the stats."""
+        inserted, failed = counts
+        self.stats["instructions_inserted"] += inserted
+        self.stats["errors"] += failed
+
     def _validate_instruction(self, instruction: InstructionRecord) -> bool:
         """Validate instruction record."""
+        if (
+            instruction.isa
+            and instruction.mnemonic
+            and instruction.category
+            and instruction.extension
+        ):
+            return True
+
+        self._log_invalid(instruction)
+        return False
+
+    def _log_invalid(self, instruction: InstructionRecord):
+        """Log why an instruction record failed validation."""
         if not instruction.isa:
             self.logger.warning("Instruction missing ISA")
-            return False
-
-        if not instruction.mnemonic:
+        elif not instruction.mnemonic:
             self.logger.warning("Instruction missing mnemonic")
-            return False
-
-        if not instruction.category:
-            self.logger.warning(f"Instruction {instruction.mnemonic} missing category")
-            return False
-
-        if not instruction.extension:
-            self.logger.warning(f"Instruction {instruction.mnemonic} missing extension")
-            return False
-
-        return True
+        elif not instruction.category:
+            self.logger.warning("Instruction %s missing category", instruction.mnemonic)
+        else:
+            self.logger.warning(
+                "Instruction %s missing extension", instruction.mnemonic
+            )
 
     def log_warning(self, message: str):
         """Log warning and increment warning counter."""
@@ -200,10 +346,7 @@ class ISAImporterRegistry:
 
     def register(self, importer_class: type):
         """Register an importer class."""
-        # Create temporary instance to get ISA name
-        temp_instance = importer_class(db=None)
-        isa_name = temp_instance.isa_name
-        self._importers[isa_name] = importer_class
+        self._importers[importer_class.isa_name] = importer_class
 
     def get_importer(self, isa_name: str, db: ISADatabase) -> Optional[ISAImporter]:
         """Get importer instance for ISA."""
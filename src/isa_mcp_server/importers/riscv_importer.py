@@ -10,14 +10,13 @@ from .base import ISAImporter
 class RISCVImporter(ISAImporter):
     """Importer for RISC-V instruction data."""
 
+    isa_name = "riscv"
+    is_implemented = False
+
     def __init__(self, db):
         super().__init__(db)
         self._version = "1.0.0"
 
-    @property
-    def isa_name(self) -> str:
-        return "riscv"
-
     @property
     def importer_version(self) -> str:
         return self._version
@@ -27,7 +26,7 @@ class RISCVImporter(ISAImporter):
         # TODO: Implement version detection for RISC-V specification
         return None
 
-    async def parse_sources(
+    def parse_sources(
         self, source_dir: Path
     ) -> AsyncGenerator[InstructionRecord, None]:
         """Parse RISC-V source files and yield instruction records."""
@@ -35,6 +34,6 @@ class RISCVImporter(ISAImporter):
         # This will need to handle RISC-V specification formats
         # (possibly LaTeX, markdown, or other documentation formats)
 
-        self.log_error("RISC-V importer not yet implemented")
-        return
-        yield  # Make this a generator function
+        # Not a generator: there is nothing to yield, so direct callers fail
+        # at the call. import_from_source skips via is_implemented instead
+        raise NotImplementedError("RISC-V importer not yet implemented")
@@ -1,8 +1,26 @@
 """XED importer for Intel x86 instruction data."""
 
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import pickle
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import AsyncGenerator, List, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from ..isa_database import (
     EncodingRecord,
@@ -11,21 +29,304 @@ from ..isa_database import (
 )
 from ..xed_metadata_parser import XEDMetadataParser
 from .base import ISAImporter
-from .xed_parser import XEDInstruction, XEDParser
+from .xed_parser import (
+    FLAG_RE,
+    HEX_BYTE_RE,
+    IMMEDIATE_RE,
+    XEDInstruction,
+    XEDParser,
+)
+
+# Extension directories under datafiles/ with additional .xed.txt files
+_EXTENSION_DIRS = (
+    "avx",
+    "avx512f",
+    "avx512cd",
+    "avx512ifma",
+    "avx512vbmi",
+    "avx512-bf16",
+    "avx512-fp16",
+    "avx512-skx",
+    "avx-vnni",
+    "hsw",
+    "hswavx",
+    "hswbmi",
+    "bdw",
+    "skl",
+    "knl",
+    "knm",
+    "cet",
+    "sha",
+    "gfni-vaes-vpcl",
+    "clwb",
+    "clflushopt",
+    "movdir",
+    "enqcmd",
+    "serialize",
+    "tsxldtrk",
+    "amx-spr",
+    "amx-bf16",
+    "amx-int8",
+    "amx-fp16",
+    "amx-complex",
+    "amx-tf32",
+    "apx-f",
+)
+
+# Format of the pickled records in the parse cache, part of its key. Bump it
+# whenever parsing or record conversion changes what is stored, so existing
+# caches are not reused with stale records
+_PARSE_CACHE_FORMAT = 2
+
+# Characters replaced when a source version is used in a cache file name
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w.-]")
+
+# Syntax placeholder per operand type; other types are used verbatim
+_TYPE_TO_TOKEN = {"register": "reg", "memory": "mem", "immediate": "imm"}
+
+# Common XED operand types (without "()") mapped to our operand types
+_OPERAND_TYPE_MAPPING = {
+    "GPR8_B": "register",
+    "GPR8_SB": "register",
+    "GPR16_B": "register",
+    "GPR32_B": "register",
+    "GPR64_B": "register",
+    "GPRv_B": "register",
+    "GPRz_B": "register",
+    "GPRy_B": "register",
+    "XMM_B": "register",
+    "XMM_R": "register",
+    "YMM_B": "register",
+    "YMM_R": "register",
+    "ZMM_B": "register",
+    "ZMM_R": "register",
+    "MEM0": "memory",
+    "MEM1": "memory",
+    "AGEN": "memory",
+    "IMM0": "immediate",
+    "IMM1": "immediate",
+    "UIMM8": "immediate",
+    "SIMM8": "immediate",
+    "UIMM16": "immediate",
+    "SIMM16": "immediate",
+    "UIMM32": "immediate",
+    "SIMM32": "immediate",
+    "SIMMz": "immediate",
+    "b": "immediate",
+    "d": "immediate",
+    "w": "immediate",
+    "z": "immediate",
+    "mem8": "memory",
+    "mem16": "memory",
+    "mem32": "memory",
+    "mem64": "memory",
+    "mem128": "memory",
+    "mem256": "memory",
+    "mem512": "memory",
+    "mem32real": "memory",
+    "mem64real": "memory",
+    "mem80real": "memory",
+}
+
+# Operand tokens: either "NAME=TYPE:ACCESS[:SIZE]" or, with no "=" at all,
+# "NAME:ACCESS[:TYPE]"; anything after a further ":" is ignored
+_OPERAND_RE = re.compile(r"(?:([^=]*)=([^:]*)|(?!.*=)([^:]*)):([^:]*)(?::([^:]*))?")
+
+# Pattern tokens that restrict an instruction to a processor mode
+_MODE_MARKER_RE = re.compile(r"mode64|mode32|not64|rexw_prefix|rex_prefix", re.I)
+# Instruction classes that are primarily 64-bit
+_SYSCALL_ICLASSES = frozenset({"SYSCALL", "SYSRET"})
+
+# XED ISA_SET mapped to the CPUID features it requires
+_ISA_SET_CPUID_FEATURES: Dict[str, Tuple[str, ...]] = {
+    "I86": (),
+    "I186": (),
+    "I286": (),
+    "I386": (),
+    "I486": (),
+    "PENTIUM": (),
+    "PPRO": (),
+    "MMX": ("MMX",),
+    "SSE": ("SSE",),
+    "SSE2": ("SSE2",),
+    "SSE3": ("SSE3",),
+    "SSSE3": ("SSSE3",),
+    "SSE4": ("SSE4.1",),
+    "SSE42": ("SSE4.2",),
+    "AVX": ("AVX",),
+    "AVX2": ("AVX2",),
+    "AVX512F": ("AVX512F",),
+    "AVX512CD": ("AVX512CD",),
+    "AVX512ER": ("AVX512ER",),
+    "AVX512PF": ("AVX512PF",),
+    "AVX512DQ": ("AVX512DQ",),
+    "AVX512BW": ("AVX512BW",),
+    "AVX512VL": ("AVX512VL",),
+    "AVX512IFMA": ("AVX512IFMA",),
+    "AVX512VBMI": ("AVX512VBMI",),
+    "AVX512VBMI2": ("AVX512VBMI2",),
+    "AVX512VNNI": ("AVX512VNNI",),
+    "AVX512BF16": ("AVX512_BF16",),
+    "AVX512VP2INTERSECT": ("AVX512_VP2INTERSECT",),
+    "AVX512FP16": ("AVX512_FP16",),
+    "BMI1": ("BMI1",),
+    "BMI2": ("BMI2",),
+    "ADX": ("ADX",),
+    "SHA": ("SHA",),
+    "AES": ("AES",),
+    "PCLMULQDQ": ("PCLMULQDQ",),
+    "RDRAND": ("RDRAND",),
+    "RDSEED": ("RDSEED",),
+    "F16C": ("F16C",),
+    "FMA": ("FMA",),
+    "MOVBE": ("MOVBE",),
+    "POPCNT": ("POPCNT",),
+    "LZCNT": ("LZCNT",),
+    "TBM": ("TBM",),
+    "PREFETCHW": ("PREFETCHW",),
+    "CLFLUSHOPT": ("CLFLUSHOPT",),
+    "CLWB": ("CLWB",),
+    "FSGSBASE": ("FSGSBASE",),
+    "INVPCID": ("INVPCID",),
+    "RTM": ("RTM",),
+    "HLE": ("HLE",),
+    "MPX": ("MPX",),
+    "XSAVE": ("XSAVE",),
+    "XSAVEOPT": ("XSAVEOPT",),
+    "XSAVEC": ("XSAVEC",),
+    "XSAVES": ("XSAVES",),
+    "CET": ("CET_IBT", "CET_SS"),
+    "ENQCMD": ("ENQCMD",),
+    "SERIALIZE": ("SERIALIZE",),
+    "TSXLDTRK": ("TSXLDTRK",),
+    "AMX_BF16": ("AMX_BF16",),
+    "AMX_INT8": ("AMX_INT8",),
+    "AMX_TILE": ("AMX_TILE",),
+}
+
+# XED flag names mapped to x86 flag names
+_FLAG_MAPPING = {
+    "fc0": "CF",
+    "fc1": "PF",
+    "fc2": "AF",
+    "fc3": "ZF",
+    "fc4": "SF",
+    "fc5": "TF",
+    "fc6": "IF",
+    "fc7": "DF",
+    "fc8": "OF",
+    "fc9": "IOPL",
+    "fc10": "NT",
+    "fc11": "RF",
+    "fc12": "VM",
+    "fc13": "AC",
+    "fc14": "VIF",
+    "fc15": "VIP",
+    "fc16": "ID",
+    "of": "OF",
+    "sf": "SF",
+    "zf": "ZF",
+    "af": "AF",
+    "pf": "PF",
+    "cf": "CF",
+}
+# Flag actions that modify the flag
+_FLAG_WRITE_ACTIONS = frozenset({"mod", "w", "set", "clr"})
+
+# Description suffixes for common XED instruction categories
+_CATEGORY_DESCRIPTIONS = {
+    "DATAXFER": "Data transfer operation",
+    "BINARY": "Binary arithmetic operation",
+    "LOGICAL": "Logical operation",
+    "SHIFT": "Shift operation",
+    "ROTATE": "Rotate operation",
+    "BITBYTE": "Bit manipulation operation",
+    "FLAGOP": "Flag operation",
+    "COND_BR": "Conditional branch",
+    "UNCOND_BR": "Unconditional branch",
+    "CALL": "Subroutine call",
+    "RET": "Return from subroutine",
+    "PUSH": "Push to stack",
+    "POP": "Pop from stack",
+    "STRINGOP": "String operation",
+    "CONVERT": "Data conversion",
+    "COMIS": "Compare and set flags",
+    "FCMOV": "Floating-point conditional move",
+    "X87_ALU": "x87 floating-point arithmetic",
+    "MMX": "MMX operation",
+    "SSE": "SSE operation",
+    "AVX": "AVX operation",
+    "AVX2": "AVX2 operation",
+    "AVX512": "AVX512 operation",
+}
+
+
+def _memoized(cache: Dict[str, Any], key: str, parse: Callable[[str], Any]) -> Any:
+    """Return parse(key), computing it only the first time key is seen."""
+    try:
+        return cache[key]
+    except KeyError:
+        value = cache[key] = parse(key)
+        return value
+
+
+def _mode_markers(pattern: str) -> FrozenSet[str]:
+    """Return the lowercased processor-mode markers in an XED pattern."""
+    return frozenset(marker.lower() for marker in _MODE_MARKER_RE.findall(pattern))
+
+
+def _in_chunks(
+    records: List[InstructionRecord], size: int
+) -> Iterator[List[InstructionRecord]]:
+    """Split records into lists of at most size records."""
+    for start in range(0, len(records), size):
+        yield records[start : start + size]
+
+
+def _parse_file_in_worker(
+    file_path: Path,
+) -> Tuple[List[InstructionRecord], List[str]]:
+    """Parse one XED instruction file in a worker process.
+
+    Returns the records together with the errors met while parsing, so the
+    importer in the main process can log and count them.
+    """
+    importer = XEDImporter(None)
+    errors: List[str] = []
+    importer.log_error = errors.append
+    return list(importer._iter_file_records(file_path)), errors
 
 
 class XEDImporter(ISAImporter):
     """Importer for XED instruction data."""
 
-    def __init__(self, db):
+    isa_name = "x86_32,x86_64"  # This importer handles both architectures
+
+    def __init__(
+        self,
+        db,
+        parse_cache_dir: Optional[Path] = None,
+        parse_workers: Optional[int] = None,
+    ):
         super().__init__(db)
+        # Directory for pickled parse results reused by later imports of the
+        # same sources; caching is off when None
+        self.parse_cache_dir = parse_cache_dir
+        # Number of worker processes parsing source files in parallel; files
+        # are parsed in this process when None
+        self.parse_workers = parse_workers
         self.parser = XEDParser()
         self._version = "1.0.0"
         self._arch_metadata_populated = False
-
-    @property
-    def isa_name(self) -> str:
-        return "x86_32,x86_64"  # This importer handles both architectures
+        # Parsed operand, pattern and flags strings; many XED entries repeat
+        # them, and the parsed records are shared read-only between records
+        self._operands_cache: Dict[str, List[OperandRecord]] = {}
+        self._encoding_cache: Dict[str, Optional[EncodingRecord]] = {}
+        self._flags_cache: Dict[str, List[str]] = {}
+        self._mode_markers_cache: Dict[str, FrozenSet[str]] = {}
+        # Files or entries that failed to parse; a parse with failures is
+        # incomplete and is not written to the parse cache
+        self._parse_errors = 0
 
     @property
     def importer_version(self) -> str:
@@ -46,80 +347,191 @@ class XEDImporter(ISAImporter):
         self, source_dir: Path
     ) -> AsyncGenerator[InstructionRecord, None]:
         """Parse XED source files and yield instruction records."""
+        async for batch in self.parse_source_batches(source_dir):
+            for instruction in batch:
+                yield instruction
+
+    async def parse_source_batches(
+        self, source_dir: Path
+    ) -> AsyncGenerator[List[InstructionRecord], None]:
+        """Parse XED source files and yield the records of each parsed chunk."""
+        main_file, extension_files = self._find_source_files(source_dir)
+        source_files = ([main_file] if main_file else []) + extension_files
+
+        cache_file = self._parse_cache_file(source_dir, source_files)
+        if cache_file is not None:
+            cached = await asyncio.to_thread(self._load_parse_cache, cache_file)
+            if cached is not None:
+                self.logger.info(f"Loaded parsed instructions from {cache_file}")
+                for batch in _in_chunks(cached, self.parse_chunk_size):
+                    yield batch
+                return
+
+        parse_errors = self._parse_errors
+        if self.parse_workers and len(source_files) > 1:
+            batches = self._parse_files_in_workers(source_files, main_file)
+        else:
+            batches = self._parse_files(source_files, main_file)
+
+        parsed: List[InstructionRecord] = []
+        async for batch in batches:
+            if cache_file is not None:
+                parsed.extend(batch)
+            yield batch
+
+        if cache_file is None:
+            return
+        if self._parse_errors > parse_errors:
+            self.logger.warning(
+                f"Not writing parse cache {cache_file}: sources failed to parse"
+            )
+            return
+        await asyncio.to_thread(self._save_parse_cache, cache_file, parsed)
+
+    async def _parse_files(
+        self, source_files: List[Path], main_file: Optional[Path]
+    ) -> AsyncGenerator[List[InstructionRecord], None]:
+        """Parse source files one after another in this process."""
+        self._operands_cache.clear()
+        self._encoding_cache.clear()
+        self._flags_cache.clear()
+        self._mode_markers_cache.clear()
+
+        for isa_file in source_files:
+            self._log_processing(isa_file, main_file)
+            async for batch in self._process_file(isa_file):
+                yield batch
+
+    async def _parse_files_in_workers(
+        self, source_files: List[Path], main_file: Optional[Path]
+    ) -> AsyncGenerator[List[InstructionRecord], None]:
+        """Parse source files in parallel worker processes, in file order."""
+        loop = asyncio.get_running_loop()
+        # Spawned workers start clean instead of forking a process that is
+        # already running event loop and database threads
+        pool = ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        try:
+            futures = [
+                loop.run_in_executor(pool, _parse_file_in_worker, isa_file)
+                for isa_file in source_files
+            ]
+            for isa_file, future in zip(source_files, futures):
+                self._log_processing(isa_file, main_file)
+                records, errors = await future
+                for message in errors:
+                    self._log_parse_error(message)
+                for batch in _in_chunks(records, self.parse_chunk_size):
+                    yield batch
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _log_processing(self, isa_file: Path, main_file: Optional[Path]):
+        """Log which instruction file is being processed."""
+        if isa_file == main_file:
+            self.logger.info(f"Processing main instruction file: {main_file}")
+        else:
+            self.logger.debug("Processing extension file: %s", isa_file)
+
+    def _find_source_files(self, source_dir: Path) -> Tuple[Optional[Path], List[Path]]:
+        """Find the main instruction file and the extension instruction files."""
         datafiles_dir = source_dir / "datafiles"
         if not datafiles_dir.exists():
             datafiles_dir = source_dir
 
-        # Process main instruction file
         main_file = datafiles_dir / "xed-isa.txt"
-        if main_file.exists():
-            self.logger.info(f"Processing main instruction file: {main_file}")
-            async for instruction in self._process_file(main_file):
-                yield instruction
+        extension_files = []
+        for ext_dir in _EXTENSION_DIRS:
+            extension_files.extend(self._list_extension_files(datafiles_dir / ext_dir))
+        return (main_file if main_file.exists() else None), extension_files
+
+    def _parse_cache_file(
+        self, source_dir: Path, source_files: List[Path]
+    ) -> Optional[Path]:
+        """Return the parse cache file for these sources, if caching is enabled.
+
+        The name combines the XED VERSION with a digest of the cache format
+        and each source file's path, size and modification time, so edited
+        sources and changed record conversion miss the cache.
+        """
+        if self.parse_cache_dir is None or not source_files:
+            return None
 
-        # Process extension files
-        extension_dirs = [
-            "avx",
-            "avx512f",
-            "avx512cd",
-            "avx512ifma",
-            "avx512vbmi",
-            "avx512-bf16",
-            "avx512-fp16",
-            "avx512-skx",
-            "avx-vnni",
-            "hsw",
-            "hswavx",
-            "hswbmi",
-            "bdw",
-            "skl",
-            "knl",
-            "knm",
-            "cet",
-            "sha",
-            "gfni-vaes-vpcl",
-            "clwb",
-            "clflushopt",
-            "movdir",
-            "enqcmd",
-            "serialize",
-            "tsxldtrk",
-            "amx-spr",
-            "amx-bf16",
-            "amx-int8",
-            "amx-fp16",
-            "amx-complex",
-            "amx-tf32",
-            "apx-f",
-        ]
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(f"{self._version}\0{_PARSE_CACHE_FORMAT}\0".encode())
+        for source_file in source_files:
+            stat = source_file.stat()
+            digest.update(
+                f"{source_file}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode()
+            )
+        version = _UNSAFE_FILENAME_RE.sub(
+            "_", self.get_source_version(source_dir) or "unknown"
+        )
+        return self.parse_cache_dir / f"xed-{version}-{digest.hexdigest()}.pkl"
 
-        for ext_dir in extension_dirs:
-            ext_path = datafiles_dir / ext_dir
-            if ext_path.exists():
-                # Look for .xed.txt files in extension directory
-                for isa_file in ext_path.glob("*.xed.txt"):
-                    self.logger.info(f"Processing extension file: {isa_file}")
-                    async for instruction in self._process_file(isa_file):
-                        yield instruction
+    def _load_parse_cache(self, cache_file: Path) -> Optional[List[InstructionRecord]]:
+        """Load cached instruction records, or None if missing or unreadable."""
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.log_warning(f"Ignoring unreadable parse cache {cache_file}: {e}")
+            return None
 
-    async def _process_file(
+    def _save_parse_cache(self, cache_file: Path, records: List[InstructionRecord]):
+        """Write instruction records to the parse cache."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial
+            # cache, even if two imports run at once
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            self.log_warning(f"Could not write parse cache {cache_file}: {e}")
+
+    def _list_extension_files(self, ext_path: Path) -> List[Path]:
+        """List .xed.txt files in an extension directory, if it exists."""
+        # One scandir pass, using the directory entry types instead of a stat
+        # per entry; symlinked files are still followed
+        try:
+            with os.scandir(ext_path) as entries:
+                return [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".xed.txt") and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+    def _process_file(
         self, file_path: Path
-    ) -> AsyncGenerator[InstructionRecord, None]:
-        """Process a single XED instruction file."""
+    ) -> AsyncGenerator[List[InstructionRecord], None]:
+        """Process a single XED instruction file in chunks of records."""
+        return self._chunked_in_thread(self._iter_file_records(file_path))
+
+    def _iter_file_records(self, file_path: Path) -> Iterator[InstructionRecord]:
+        """Parse a single XED instruction file and yield its records."""
         try:
             for xed_instruction in self.parser.parse_file(file_path):
                 try:
-                    instruction_records = self._convert_to_instruction_record(
-                        xed_instruction
-                    )
-                    for record in instruction_records:
-                        yield record
+                    yield from self._convert_to_instruction_record(xed_instruction)
                 except Exception as e:
-                    self.log_error(
+                    self._log_parse_error(
                         f"Error converting instruction {xed_instruction.iclass}: {e}"
                     )
         except Exception as e:
-            self.log_error(f"Error processing file {file_path}: {e}")
+            self._log_parse_error(f"Error processing file {file_path}: {e}")
+
+    def _log_parse_error(self, message: str):
+        """Log an error met while parsing sources and count it as a failure."""
+        self._parse_errors += 1
+        self.log_error(message)
 
     def _convert_to_instruction_record(
         self, xed_instr: XEDInstruction
@@ -134,14 +546,20 @@ class XEDImporter(ISAImporter):
         if not target_isas:
             return []
 
-        # Parse operands
-        operands = self._parse_operands(xed_instr.operands)
-
-        # Parse encoding
-        encoding = self._parse_encoding(xed_instr.pattern)
-
-        # Parse flags
-        flags_affected = self._parse_flags(xed_instr.flags) if xed_instr.flags else []
+        # Operands, encoding and flags are parsed once per distinct source
+        # string and the results shared by every record built from it, which
+        # is why records must not be mutated after conversion
+        operands = _memoized(
+            self._operands_cache, xed_instr.operands, self._parse_operands
+        )
+        encoding = _memoized(
+            self._encoding_cache, xed_instr.pattern, self._parse_encoding
+        )
+        flags_affected = (
+            _memoized(self._flags_cache, xed_instr.flags, self._parse_flags)
+            if xed_instr.flags
+            else []
+        )
 
         # Generate description
         description = self._generate_description(xed_instr)
@@ -152,26 +570,32 @@ class XEDImporter(ISAImporter):
         # Determine variant (for instructions with multiple forms)
         variant = self._determine_variant(xed_instr)
 
-        # Create instruction record for each target architecture
+        # Look up CPUID features once; records for both ISAs share the list
+        cpuid_features = self._get_cpuid_features(xed_instr)
+
+        # Create instruction record for each target architecture. Fields are
+        # passed positionally, in InstructionRecord field order, since this
+        # runs for every record and keyword calls cost about twice as much
         records = []
         for isa in target_isas:
             record = InstructionRecord(
-                isa=isa,
-                mnemonic=xed_instr.iclass,
-                variant=variant,
-                category=xed_instr.category,
-                extension=xed_instr.extension,
-                isa_set=xed_instr.isa_set,
-                description=description,
-                syntax=syntax,
-                operands=operands,
-                encoding=encoding,
-                flags_affected=flags_affected,
-                cpuid_features=self._get_cpuid_features(xed_instr),
-                cpl=xed_instr.cpl,
-                attributes=xed_instr.attributes,
-                added_version=None,
-                deprecated=False,
+                None,  # id
+                isa,
+                xed_instr.iclass,  # mnemonic
+                variant,
+                xed_instr.category,
+                xed_instr.extension,
+                xed_instr.isa_set,
+                description,
+                syntax,
+                operands,
+                encoding,
+                flags_affected,
+                cpuid_features,
+                xed_instr.cpl,
+                xed_instr.attributes,
+                None,  # added_version
+                False,  # deprecated
             )
             records.append(record)
 
@@ -179,60 +603,51 @@ class XEDImporter(ISAImporter):
 
     def _determine_target_architectures(self, xed_instr: XEDInstruction) -> List[str]:
         """Determine which architectures this instruction belongs to based on XED."""
-        isas = []
-
-        # Check pattern for mode indicators
-        pattern = xed_instr.pattern.lower() if xed_instr.pattern else ""
+        # Collect mode indicators from the pattern in one scan per pattern
+        markers = (
+            _memoized(self._mode_markers_cache, xed_instr.pattern, _mode_markers)
+            if xed_instr.pattern
+            else frozenset()
+        )
 
-        # Check for explicit mode restrictions
-        if "mode64" in pattern:
-            isas.append("x86_64")
-        if "mode32" in pattern:
-            isas.append("x86_32")
-        if "not64" in pattern:
+        if "not64" in markers:
             # Instruction not available in 64-bit mode, only 32-bit
             return ["x86_32"]
 
-        # Check attributes for mode restrictions
-        attributes = []
-        if xed_instr.attributes:
-            attributes = [attr.upper() for attr in xed_instr.attributes]
-
-        # LONGMODE extension indicates 64-bit specific instruction
-        if xed_instr.extension == "LONGMODE" or "LONGMODE" in attributes:
-            isas.append("x86_64")
-
-        # Check for 64-bit specific ISA sets
-        if xed_instr.isa_set in ["LONGMODE"]:
-            isas.append("x86_64")
-
-        # Check for REX prefix requirements (64-bit specific)
-        if "rexw_prefix" in pattern or "rex_prefix" in pattern:
-            if "x86_64" not in isas:
-                isas.append("x86_64")
-
-        # Check for 32-bit specific attributes
-        if any(attr in attributes for attr in ["PROTECTED_MODE"]) and not isas:
-            # Instructions that require protected mode but don't specify 64-bit
-            # are typically available in both modes
-            isas.extend(["x86_32", "x86_64"])
-
-        # Handle special cases for specific instructions
-        iclass = xed_instr.iclass.upper()
-        if iclass in ["SYSCALL", "SYSRET"]:
-            # These are primarily 64-bit instructions
-            isas.append("x86_64")
-        elif iclass in ["SYSENTER", "SYSEXIT"]:
-            # These work in both modes but are more commonly used in 32-bit
-            if not isas:
-                isas.extend(["x86_32", "x86_64"])
+        attributes = (
+            {attr.upper() for attr in xed_instr.attributes}
+            if xed_instr.attributes
+            else set()
+        )
 
-        # Default: if no specific mode restrictions found, available in both
-        if not isas:
-            isas = ["x86_32", "x86_64"]
+        # Explicit mode restrictions, LONGMODE extension/attribute/ISA set and
+        # REX prefix requirements all indicate 64-bit specific instructions
+        x86_32 = "mode32" in markers
+        x86_64 = (
+            "mode64" in markers
+            or "rexw_prefix" in markers
+            or "rex_prefix" in markers
+            or xed_instr.extension == "LONGMODE"
+            or xed_instr.isa_set == "LONGMODE"
+            or "LONGMODE" in attributes
+        )
 
-        # Remove duplicates and sort
-        return sorted(list(set(isas)))
+        # Instructions that require protected mode but don't specify 64-bit
+        # are typically available in both modes
+        if not (x86_32 or x86_64) and "PROTECTED_MODE" in attributes:
+            x86_32 = x86_64 = True
+
+        # SYSCALL/SYSRET are primarily 64-bit instructions
+        if xed_instr.iclass.upper() in _SYSCALL_ICLASSES:
+            x86_64 = True
+
+        # Default: if no specific mode restrictions found, available in both
+        # (this also covers SYSENTER/SYSEXIT)
+        if x86_32 and not x86_64:
+            return ["x86_32"]
+        if x86_64 and not x86_32:
+            return ["x86_64"]
+        return ["x86_32", "x86_64"]
 
     def _parse_operands(self, operands_str: str) -> List[OperandRecord]:
         """Parse XED operands string into OperandRecord list."""
@@ -241,43 +656,35 @@ class XEDImporter(ISAImporter):
 
         operands = []
 
-        # Split operands by spaces
-        parts = operands_str.split()
-
-        for part in parts:
-            if "=" in part and ":" in part:
-                # Parse operand like "REG0=GPR8_B():w"
-                name_part, rest = part.split("=", 1)
-                if ":" in rest:
-                    type_parts = rest.split(":")
-                    operand_type = type_parts[0]
-                    access = type_parts[1] if len(type_parts) > 1 else "r"
-                    size = type_parts[2] if len(type_parts) > 2 else None
-
-                    operands.append(
-                        OperandRecord(
-                            name=name_part,
-                            type=self._normalize_operand_type(operand_type),
-                            access=access,
-                            size=size,
-                            visibility="EXPLICIT",
-                        )
+        # Names, access modes and types recur across entries, so they are
+        # interned to share one copy
+        for part in operands_str.split():
+            match = _OPERAND_RE.match(part)
+            if match is None:
+                continue
+            name, operand_type, bare_name, access, field3 = match.groups()
+            if name is not None:
+                # Operand like "REG0=GPR8_B():w", optionally with a size
+                operands.append(
+                    OperandRecord(
+                        name=sys.intern(name),
+                        type=self._normalize_operand_type(operand_type),
+                        access=sys.intern(access),
+                        size=field3,
+                        visibility="EXPLICIT",
                     )
-            elif ":" in part:
-                # Parse operand like "IMM0:r:b"
-                parts_split = part.split(":")
-                if len(parts_split) >= 2:
-                    operands.append(
-                        OperandRecord(
-                            name=parts_split[0],
-                            type=self._normalize_operand_type(
-                                parts_split[2] if len(parts_split) > 2 else "unknown"
-                            ),
-                            access=parts_split[1],
-                            size=None,
-                            visibility="EXPLICIT",
-                        )
+                )
+            else:
+                # Operand like "IMM0:r:b", where the third field is the type
+                operands.append(
+                    OperandRecord(
+                        name=sys.intern(bare_name),
+                        type=self._normalize_operand_type(field3 or "unknown"),
+                        access=sys.intern(access),
+                        size=None,
+                        visibility="EXPLICIT",
                     )
+                )
 
         return operands
 
@@ -287,62 +694,30 @@ class XEDImporter(ISAImporter):
             return "unknown"
 
         # Remove function call syntax
-        xed_type = re.sub(r"\(\)", "", xed_type)
-
-        # Map common XED types to our format
-        type_mapping = {
-            "GPR8_B": "register",
-            "GPR8_SB": "register",
-            "GPR16_B": "register",
-            "GPR32_B": "register",
-            "GPR64_B": "register",
-            "GPRv_B": "register",
-            "GPRz_B": "register",
-            "GPRy_B": "register",
-            "XMM_B": "register",
-            "XMM_R": "register",
-            "YMM_B": "register",
-            "YMM_R": "register",
-            "ZMM_B": "register",
-            "ZMM_R": "register",
-            "MEM0": "memory",
-            "MEM1": "memory",
-            "AGEN": "memory",
-            "IMM0": "immediate",
-            "IMM1": "immediate",
-            "UIMM8": "immediate",
-            "SIMM8": "immediate",
-            "UIMM16": "immediate",
-            "SIMM16": "immediate",
-            "UIMM32": "immediate",
-            "SIMM32": "immediate",
-            "SIMMz": "immediate",
-            "b": "immediate",
-            "d": "immediate",
-            "w": "immediate",
-            "z": "immediate",
-            "mem8": "memory",
-            "mem16": "memory",
-            "mem32": "memory",
-            "mem64": "memory",
-            "mem128": "memory",
-            "mem256": "memory",
-            "mem512": "memory",
-            "mem32real": "memory",
-            "mem64real": "memory",
-            "mem80real": "memory",
-        }
-
-        return type_mapping.get(xed_type, xed_type.lower())
+        xed_type = xed_type.replace("()", "")
+
+        # Map common XED types to our format; others are lowercased
+        return _OPERAND_TYPE_MAPPING.get(xed_type) or sys.intern(xed_type.lower())
 
     def _parse_encoding(self, pattern_str: str) -> Optional[EncodingRecord]:
         """Parse XED pattern into EncodingRecord."""
         if not pattern_str:
             return None
 
+        # Opcode bytes start with "0x" and the MODRM/SIB/DISP/immediate tokens
+        # all contain "(", so patterns with neither only need the MOD[ check
+        if "0x" not in pattern_str and "(" not in pattern_str:
+            return EncodingRecord(
+                pattern=pattern_str,
+                opcode=None,
+                modrm="MOD[" in pattern_str,
+                sib=False,
+                displacement=None,
+                immediate=None,
+            )
+
         # Extract opcode bytes
-        hex_pattern = re.compile(r"0x[0-9A-Fa-f]{2}")
-        hex_matches = hex_pattern.findall(pattern_str)
+        hex_matches = HEX_BYTE_RE.findall(pattern_str)
         opcode = " ".join(hex_matches) if hex_matches else None
 
         # Check for ModR/M byte
@@ -352,18 +727,7 @@ class XEDImporter(ISAImporter):
         sib = "SIB()" in pattern_str
 
         # Check for immediate values
-        immediate = any(
-            imm in pattern_str
-            for imm in [
-                "UIMM8()",
-                "SIMM8()",
-                "UIMM16()",
-                "SIMM16()",
-                "UIMM32()",
-                "SIMM32()",
-                "SIMMz()",
-            ]
-        )
+        immediate = IMMEDIATE_RE.search(pattern_str) is not None
 
         # Check for displacement
         displacement_bool = "DISP(" in pattern_str
@@ -382,44 +746,15 @@ class XEDImporter(ISAImporter):
         if not flags_str:
             return []
 
-        flags = []
-
         # XED flags format: MUST [ fc0-u   fc1-mod fc2-u   fc3-u   ]
-        # Map XED flag names to x86 flag names
-        flag_mapping = {
-            "fc0": "CF",
-            "fc1": "PF",
-            "fc2": "AF",
-            "fc3": "ZF",
-            "fc4": "SF",
-            "fc5": "TF",
-            "fc6": "IF",
-            "fc7": "DF",
-            "fc8": "OF",
-            "fc9": "IOPL",
-            "fc10": "NT",
-            "fc11": "RF",
-            "fc12": "VM",
-            "fc13": "AC",
-            "fc14": "VIF",
-            "fc15": "VIP",
-            "fc16": "ID",
-            "of": "OF",
-            "sf": "SF",
-            "zf": "ZF",
-            "af": "AF",
-            "pf": "PF",
-            "cf": "CF",
-        }
-
-        # Extract flag conditions
-        flag_pattern = re.compile(r"([a-zA-Z]+\d*)-([a-zA-Z]+)")
-        matches = flag_pattern.findall(flags_str)
-
-        for flag_name, flag_action in matches:
-            if flag_action in ["mod", "w", "set", "clr"]:
-                mapped_flag = flag_mapping.get(flag_name.lower(), flag_name.upper())
-                if mapped_flag not in flags:
+        # Keep flags that are written, in first-seen order without duplicates
+        flags = []
+        seen = set()
+        for flag_name, flag_action in FLAG_RE.findall(flags_str):
+            if flag_action in _FLAG_WRITE_ACTIONS:
+                mapped_flag = _FLAG_MAPPING.get(flag_name.lower(), flag_name.upper())
+                if mapped_flag not in seen:
+                    seen.add(mapped_flag)
                     flags.append(mapped_flag)
 
         return flags
@@ -430,35 +765,10 @@ class XEDImporter(ISAImporter):
         base_name = xed_instr.disasm or xed_instr.iclass
 
         # Basic descriptions for common instruction categories
-        category_descriptions = {
-            "DATAXFER": f"{base_name} - Data transfer operation",
-            "BINARY": f"{base_name} - Binary arithmetic operation",
-            "LOGICAL": f"{base_name} - Logical operation",
-            "SHIFT": f"{base_name} - Shift operation",
-            "ROTATE": f"{base_name} - Rotate operation",
-            "BITBYTE": f"{base_name} - Bit manipulation operation",
-            "FLAGOP": f"{base_name} - Flag operation",
-            "COND_BR": f"{base_name} - Conditional branch",
-            "UNCOND_BR": f"{base_name} - Unconditional branch",
-            "CALL": f"{base_name} - Subroutine call",
-            "RET": f"{base_name} - Return from subroutine",
-            "PUSH": f"{base_name} - Push to stack",
-            "POP": f"{base_name} - Pop from stack",
-            "STRINGOP": f"{base_name} - String operation",
-            "CONVERT": f"{base_name} - Data conversion",
-            "COMIS": f"{base_name} - Compare and set flags",
-            "FCMOV": f"{base_name} - Floating-point conditional move",
-            "X87_ALU": f"{base_name} - x87 floating-point arithmetic",
-            "MMX": f"{base_name} - MMX operation",
-            "SSE": f"{base_name} - SSE operation",
-            "AVX": f"{base_name} - AVX operation",
-            "AVX2": f"{base_name} - AVX2 operation",
-            "AVX512": f"{base_name} - AVX512 operation",
-        }
-
-        return category_descriptions.get(
-            xed_instr.category, f"{base_name} - {xed_instr.category} operation"
-        )
+        description = _CATEGORY_DESCRIPTIONS.get(xed_instr.category)
+        if description is None:
+            description = f"{xed_instr.category} operation"
+        return f"{base_name} - {description}"
 
     def _generate_syntax(
         self, xed_instr: XEDInstruction, operands: List[OperandRecord]
@@ -466,25 +776,17 @@ class XEDImporter(ISAImporter):
         """Generate assembly syntax string."""
         mnemonic = xed_instr.disasm or xed_instr.iclass
 
-        # Filter explicit operands
-        explicit_operands = [op for op in operands if op.visibility == "EXPLICIT"]
+        # Syntax tokens for explicit operands
+        parts = [
+            _TYPE_TO_TOKEN.get(op.type, op.type)
+            for op in operands
+            if op.visibility == "EXPLICIT"
+        ]
 
-        if not explicit_operands:
+        if not parts:
             return mnemonic
 
-        # Generate operand strings
-        operand_strings = []
-        for op in explicit_operands:
-            if op.type == "register":
-                operand_strings.append("reg")
-            elif op.type == "memory":
-                operand_strings.append("mem")
-            elif op.type == "immediate":
-                operand_strings.append("imm")
-            else:
-                operand_strings.append(op.type)
-
-        return f"{mnemonic} {', '.join(operand_strings)}"
+        return mnemonic + " " + ", ".join(parts)
 
     def _determine_variant(self, xed_instr: XEDInstruction) -> Optional[str]:
         """Determine instruction variant based on operands/encoding."""
@@ -498,87 +800,18 @@ class XEDImporter(ISAImporter):
 
         # Generate variant based on operands
         if xed_instr.operands:
-            # Create a hash of operands to differentiate variants
-            operand_hash = hash(xed_instr.operands)
-            return f"var_{abs(operand_hash) % 10000:04d}"
+            # Short digest of the operands to differentiate variants. Unlike
+            # hash() it is stable across runs, and 32 bits keeps collisions
+            # (which would replace rows sharing isa/mnemonic/variant) unlikely
+            digest = hashlib.blake2b(xed_instr.operands.encode(), digest_size=4)
+            return f"var_{digest.hexdigest()}"
 
         return None
 
     def _get_cpuid_features(self, xed_instr: XEDInstruction) -> List[str]:
         """Get CPUID features for instruction."""
-        features = []
-
-        # Map ISA_SET to CPUID features
-        isa_set_mapping = {
-            "I86": [],
-            "I186": [],
-            "I286": [],
-            "I386": [],
-            "I486": [],
-            "PENTIUM": [],
-            "PPRO": [],
-            "MMX": ["MMX"],
-            "SSE": ["SSE"],
-            "SSE2": ["SSE2"],
-            "SSE3": ["SSE3"],
-            "SSSE3": ["SSSE3"],
-            "SSE4": ["SSE4.1"],
-            "SSE42": ["SSE4.2"],
-            "AVX": ["AVX"],
-            "AVX2": ["AVX2"],
-            "AVX512F": ["AVX512F"],
-            "AVX512CD": ["AVX512CD"],
-            "AVX512ER": ["AVX512ER"],
-            "AVX512PF": ["AVX512PF"],
-            "AVX512DQ": ["AVX512DQ"],
-            "AVX512BW": ["AVX512BW"],
-            "AVX512VL": ["AVX512VL"],
-            "AVX512IFMA": ["AVX512IFMA"],
-            "AVX512VBMI": ["AVX512VBMI"],
-            "AVX512VBMI2": ["AVX512VBMI2"],
-            "AVX512VNNI": ["AVX512VNNI"],
-            "AVX512BF16": ["AVX512_BF16"],
-            "AVX512VP2INTERSECT": ["AVX512_VP2INTERSECT"],
-            "AVX512FP16": ["AVX512_FP16"],
-            "BMI1": ["BMI1"],
-            "BMI2": ["BMI2"],
-            "ADX": ["ADX"],
-            "SHA": ["SHA"],
-            "AES": ["AES"],
-            "PCLMULQDQ": ["PCLMULQDQ"],
-            "RDRAND": ["RDRAND"],
-            "RDSEED": ["RDSEED"],
-            "F16C": ["F16C"],
-            "FMA": ["FMA"],
-            "MOVBE": ["MOVBE"],
-            "POPCNT": ["POPCNT"],
-            "LZCNT": ["LZCNT"],
-            "TBM": ["TBM"],
-            "PREFETCHW": ["PREFETCHW"],
-            "CLFLUSHOPT": ["CLFLUSHOPT"],
-            "CLWB": ["CLWB"],
-            "FSGSBASE": ["FSGSBASE"],
-            "INVPCID": ["INVPCID"],
-            "RTM": ["RTM"],
-            "HLE": ["HLE"],
-            "MPX": ["MPX"],
-            "XSAVE": ["XSAVE"],
-            "XSAVEOPT": ["XSAVEOPT"],
-            "XSAVEC": ["XSAVEC"],
-            "XSAVES": ["XSAVES"],
-            "CET": ["CET_IBT", "CET_SS"],
-            "ENQCMD": ["ENQCMD"],
-            "SERIALIZE": ["SERIALIZE"],
-            "TSXLDTRK": ["TSXLDTRK"],
-            "AMX_BF16": ["AMX_BF16"],
-            "AMX_INT8": ["AMX_INT8"],
-            "AMX_TILE": ["AMX_TILE"],
-        }
-
-        if xed_instr.isa_set in isa_set_mapping:
-            features.extend(isa_set_mapping[xed_instr.isa_set])
-
-        return features
+        # Records carry lists; the shared table holds tuples
+        return list(_ISA_SET_CPUID_FEATURES.get(xed_instr.isa_set, ()))
 
     async def populate_architecture_metadata(self, source_dir: Path) -> bool:
         """Populate architecture metadata from XED datafiles."""
@@ -596,44 +829,35 @@ class XEDImporter(ISAImporter):
             # Parse architecture specifications
             architectures = parser.parse_architectures()
 
-            # Parse registers
-            x86_32_registers, x86_64_registers = parser.parse_registers()
+            # Insert architectures first so their IDs can be assigned while
+            # registers and addressing modes are constructed
+            arch_ids = self.db.insert_architectures(architectures)
+            self.logger.info(f"Inserted {len(arch_ids)} architectures")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for isa_name, arch_id in arch_ids.items():
+                    self.logger.debug(
+                        "Inserted architecture: %s (ID: %d)", isa_name, arch_id
+                    )
 
-            # Parse addressing modes
-            x86_32_modes, x86_64_modes = parser.parse_addressing_modes()
-
-            # Insert architectures
-            arch_ids = {}
-            for arch in architectures:
-                arch_id = self.db.insert_architecture(arch)
-                arch_ids[arch.isa_name] = arch_id
-                self.logger.info(
-                    f"Inserted architecture: {arch.isa_name} (ID: {arch_id})"
-                )
+            # Parse registers in a worker thread so reading xed-regs.txt does
+            # not stall other importers running on the event loop
+            x86_32_registers, x86_64_registers = await asyncio.to_thread(
+                parser.parse_registers, arch_ids["x86_32"], arch_ids["x86_64"]
+            )
 
-            # Insert registers
-            # Update architecture IDs for registers
-            for reg in x86_32_registers:
-                reg.architecture_id = arch_ids["x86_32"]
-                self.db.insert_register(reg)
+            # Parse addressing modes
+            x86_32_modes, x86_64_modes = parser.parse_addressing_modes(
+                arch_ids["x86_32"], arch_ids["x86_64"]
+            )
 
-            for reg in x86_64_registers:
-                reg.architecture_id = arch_ids["x86_64"]
-                self.db.insert_register(reg)
+            # Insert registers and addressing modes in one transaction
+            self.db.insert_architecture_metadata(
+                x86_32_registers + x86_64_registers, x86_32_modes + x86_64_modes
+            )
 
             self.logger.info(f"Inserted {len(x86_32_registers)} x86_32 registers")
             self.logger.info(f"Inserted {len(x86_64_registers)} x86_64 registers")
 
-            # Insert addressing modes
-            # Update architecture IDs for addressing modes
-            for mode in x86_32_modes:
-                mode.architecture_id = arch_ids["x86_32"]
-                self.db.insert_addressing_mode(mode)
-
-            for mode in x86_64_modes:
-                mode.architecture_id = arch_ids["x86_64"]
-                self.db.insert_addressing_mode(mode)
-
             self.logger.info(f"Inserted {len(x86_32_modes)} x86_32 addressing modes")
             self.logger.info(f"Inserted {len(x86_64_modes)} x86_64 addressing modes")
 
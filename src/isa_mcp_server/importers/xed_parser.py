@@ -1,12 +1,21 @@
 """XED instruction format parser."""
 
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+# Opcode bytes in an XED pattern
+HEX_BYTE_RE = re.compile(r"0x[0-9A-Fa-f]{2}")
+# Immediate operand tokens: UIMM8() SIMM8() UIMM16() SIMM16() UIMM32() SIMM32()
+# SIMMz()
+IMMEDIATE_RE = re.compile(r"[US]IMM(?:8|16|32)\(\)|SIMMz\(\)")
+# Flag conditions like "fc1-mod" or "zf-w"
+FLAG_RE = re.compile(r"([a-zA-Z]+\d*)-([a-zA-Z]+)")
 
-@dataclass
+
+@dataclass(slots=True)
 class XEDInstruction:
     """Represents a parsed XED instruction."""
 
@@ -41,39 +50,33 @@ class XEDParser:
     def parse_file(self, file_path: Path) -> Iterator[XEDInstruction]:
         """Parse XED instruction file and yield instructions."""
         with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        yield from self._parse_lines(lines)
+            # Stream lines from the file rather than reading them all first
+            yield from self._parse_lines(f)
 
-    def _parse_lines(self, lines: List[str]) -> Iterator[XEDInstruction]:
+    def _parse_lines(self, lines: Iterable[str]) -> Iterator[XEDInstruction]:
         """Parse lines and yield instructions."""
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        lines = iter(lines)
+        for raw_line in lines:
+            line = raw_line.strip()
 
             # Skip comments and empty lines
             if self.comment_pattern.match(line) or self.empty_pattern.match(line):
-                i += 1
                 continue
 
             # Look for start of instruction block
             if self.instruction_pattern.match(line):
-                instruction, next_i = self._parse_instruction_block(lines, i + 1)
+                instruction = self._parse_instruction_block(lines)
                 if instruction:
                     yield instruction
-                i = next_i
-            else:
-                i += 1
 
     def _parse_instruction_block(
-        self, lines: List[str], start_idx: int
-    ) -> tuple[Optional[XEDInstruction], int]:
-        """Parse single instruction block."""
+        self, lines: Iterator[str]
+    ) -> Optional[XEDInstruction]:
+        """Parse single instruction block, consuming lines up to its end."""
         instruction_data = {}
-        i = start_idx
 
-        while i < len(lines):
-            line = lines[i].strip()
+        for raw_line in lines:
+            line = raw_line.strip()
 
             # End of instruction block
             if self.end_pattern.match(line):
@@ -81,7 +84,6 @@ class XEDParser:
 
             # Skip comments and empty lines
             if self.comment_pattern.match(line) or self.empty_pattern.match(line):
-                i += 1
                 continue
 
             # Parse field
@@ -93,27 +95,25 @@ class XEDParser:
                 # Handle multi-line fields
                 if field_name == "PATTERN" and not field_value:
                     # Sometimes PATTERN is on next line
-                    i += 1
-                    if i < len(lines):
-                        field_value = lines[i].strip()
+                    field_value = next(lines, "").strip()
 
                 instruction_data[field_name] = field_value
 
-            i += 1
-
-        # Create instruction object
+        # Create instruction object. Iclass, category, extension and ISA set
+        # repeat across thousands of entries, so they are interned to share
+        # one copy
         if "ICLASS" in instruction_data:
             instruction = XEDInstruction(
-                iclass=instruction_data.get("ICLASS", ""),
+                iclass=sys.intern(instruction_data.get("ICLASS", "")),
                 uname=instruction_data.get("UNAME"),
                 cpl=(
                     int(instruction_data["CPL"])
                     if instruction_data.get("CPL")
                     else None
                 ),
-                category=instruction_data.get("CATEGORY", ""),
-                extension=instruction_data.get("EXTENSION", ""),
-                isa_set=instruction_data.get("ISA_SET", ""),
+                category=sys.intern(instruction_data.get("CATEGORY", "")),
+                extension=sys.intern(instruction_data.get("EXTENSION", "")),
+                isa_set=sys.intern(instruction_data.get("ISA_SET", "")),
                 attributes=self._parse_attributes(
                     instruction_data.get("ATTRIBUTES", "")
                 ),
@@ -123,18 +123,17 @@ class XEDParser:
                 disasm=instruction_data.get("DISASM"),
                 flags=instruction_data.get("FLAGS"),
             )
-            return instruction, i + 1
+            return instruction
 
-        return None, i + 1
+        return None
 
     def _parse_attributes(self, attributes_str: str) -> List[str]:
         """Parse attributes string into list."""
         if not attributes_str:
             return []
 
-        # Split by spaces and filter out empty strings
-        attributes = [attr.strip() for attr in attributes_str.split() if attr.strip()]
-        return attributes
+        # Split by spaces; the few dozen attribute names are shared via intern
+        return [sys.intern(attr) for attr in attributes_str.split()]
 
     def _parse_operands(self, operands_str: str) -> List[Dict[str, str]]:
         """Parse operands string into structured format."""
@@ -149,9 +148,9 @@ class XEDParser:
         for part in parts:
             if "=" in part and ":" in part:
                 # Parse operand like "REG0=GPR8_B():w"
-                name_part, rest = part.split("=", 1)
+                name_part, _, rest = part.partition("=")
                 if ":" in rest:
-                    type_part, access_part = rest.rsplit(":", 1)
+                    type_part, _, access_part = rest.rpartition(":")
                     operands.append(
                         {"name": name_part, "type": type_part, "access": access_part}
                     )
@@ -194,8 +193,7 @@ class XEDParser:
         }
 
         # Extract opcode bytes (hex values at the start)
-        hex_pattern = re.compile(r"0x[0-9A-Fa-f]{2}")
-        hex_matches = hex_pattern.findall(pattern_str)
+        hex_matches = HEX_BYTE_RE.findall(pattern_str)
         if hex_matches:
             encoding["opcode"] = " ".join(hex_matches)
 
@@ -208,16 +206,7 @@ class XEDParser:
             encoding["sib"] = True
 
         # Check for immediate values
-        imm_types = [
-            "UIMM8()",
-            "SIMM8()",
-            "UIMM16()",
-            "SIMM16()",
-            "UIMM32()",
-            "SIMM32()",
-            "SIMMz()",
-        ]
-        if any(imm in pattern_str for imm in imm_types):
+        if IMMEDIATE_RE.search(pattern_str):
             encoding["immediate"] = True
 
         # Check for displacement
@@ -235,8 +224,7 @@ class XEDParser:
 
         # XED flags format: MUST [ fc0-u   fc1-mod fc2-u   fc3-u   ]
         # Extract flag conditions
-        flag_pattern = re.compile(r"([a-zA-Z]+\d*)-([a-zA-Z]+)")
-        matches = flag_pattern.findall(flags_str)
+        matches = FLAG_RE.findall(flags_str)
 
         for flag_name, flag_action in matches:
             if flag_action in ["mod", "w", "set", "clr"]:
@@ -1,14 +1,73 @@
 """Database schema and models for ISA instruction data."""
 
 import json
+import os
 import sqlite3
 from contextlib import contextmanager
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Any, List, Optional
-
-
-@dataclass
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# INSERT statements are module constants so every call passes sqlite3 the
+# identical SQL text and hits its prepared-statement cache
+_INSERT_INSTRUCTION_SQL = """
+    INSERT OR REPLACE INTO instructions (
+        isa, mnemonic, variant, category, extension, isa_set,
+        description, syntax, operands_json, encoding_json,
+        flags_affected_json, cpuid_features_json, attributes_json,
+        cpl, added_version, deprecated
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_ARCHITECTURE_SQL = """
+    INSERT OR REPLACE INTO architectures (
+        isa_name, word_size, endianness, description, machine_mode
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+
+_INSERT_ARCHITECTURES_RETURNING_SQL = """
+    INSERT OR REPLACE INTO architectures (
+        isa_name, word_size, endianness, description, machine_mode
+    ) VALUES {values}
+    RETURNING isa_name, id
+"""
+
+_INSERT_REGISTER_SQL = """
+    INSERT OR REPLACE INTO architecture_registers (
+        architecture_id, register_name, register_class, width_bits,
+        encoding_id, is_main_register, parent_register_id, aliases_json,
+        calling_convention_preserved, register_purpose
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_ADDRESSING_MODE_SQL = """
+    INSERT OR REPLACE INTO architecture_addressing_modes (
+        architecture_id, mode_name, description, example_syntax
+    ) VALUES (?, ?, ?, ?)
+"""
+
+# Large enough to hold every distinct statement used during an import
+_CACHED_STATEMENTS = 512
+
+# Secondary indexes on the register and addressing mode tables, as
+# (index_name, "table(columns)") pairs
+_METADATA_INDEXES = (
+    ("idx_registers_architecture_id", "architecture_registers(architecture_id)"),
+    (
+        "idx_addressing_modes_architecture_id",
+        "architecture_addressing_modes(architecture_id)",
+    ),
+    ("idx_registers_parent_id", "architecture_registers(parent_register_id)"),
+    ("idx_registers_purpose", "architecture_registers(register_purpose)"),
+)
+
+
+@dataclass(slots=True)
 class OperandRecord:
     """Represents an instruction operand."""
 
@@ -19,7 +78,7 @@ class OperandRecord:
     visibility: str = "EXPLICIT"  # EXPLICIT, IMPLICIT, SUPPRESSED
 
 
-@dataclass
+@dataclass(slots=True)
 class EncodingRecord:
     """Represents instruction encoding information."""
 
@@ -32,9 +91,13 @@ class EncodingRecord:
     immediate: Optional[str] = None  # immediate info
 
 
-@dataclass
+@dataclass(slots=True)
 class InstructionRecord:
-    """Represents a complete instruction record."""
+    """Represents a complete instruction record.
+
+    Importers may share the operand, encoding and list values between records
+    built from the same source text, so records are read-only once built.
+    """
 
     id: Optional[int] = None
     isa: str = ""
@@ -69,7 +132,7 @@ class InstructionRecord:
             self.attributes = []
 
 
-@dataclass
+@dataclass(slots=True)
 class ArchitectureRecord:
     """Represents architecture metadata."""
 
@@ -81,7 +144,7 @@ class ArchitectureRecord:
     machine_mode: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RegisterRecord:
     """Represents a register definition."""
 
@@ -100,7 +163,7 @@ class RegisterRecord:
     register_purpose: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AddressingModeRecord:
     """Represents an addressing mode."""
 
@@ -111,26 +174,70 @@ class AddressingModeRecord:
     example_syntax: str = ""
 
 
+# Shared serializations for the common empty cases of JSON columns
+_EMPTY_JSON_ARRAY = "[]"
+_JSON_NULL = "null"
+
+# Operand and encoding records only hold primitives, so a shallow field copy
+# serializes them the same as asdict() without its recursive deep copy
+_OPERAND_FIELDS = tuple(f.name for f in fields(OperandRecord))
+_ENCODING_FIELDS = tuple(f.name for f in fields(EncodingRecord))
+
+
+def _dump_json(value: Any) -> str:
+    """Serialize a JSON column value, with orjson when it is installed."""
+    if orjson:
+        # Decode so the column keeps TEXT affinity rather than becoming a BLOB
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _dump_json_list(values: Optional[List[Any]]) -> str:
+    """Serialize a list column, reusing constants for None and empty lists."""
+    if values is None:
+        return _JSON_NULL
+    if not values:
+        return _EMPTY_JSON_ARRAY
+    return _dump_json(values)
+
+
 class ISADatabase:
     """Database manager for ISA instruction data."""
 
-    def __init__(self, db_path: str = "isa_docs.db"):
+    def __init__(self, db_path: str = "isa_docs.db", bulk_mode: bool = False):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Bulk mode trades durability for insert speed during offline imports
+        self.bulk_mode = bulk_mode
 
     @contextmanager
     def get_connection(self):
         """Get database connection with proper cleanup."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = sqlite3.connect(str(self.db_path), cached_statements=_CACHED_STATEMENTS)
         conn.row_factory = sqlite3.Row
         try:
+            self._configure_connection(conn)
             yield conn
         finally:
             conn.close()
 
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Apply per-connection performance PRAGMAs."""
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        if self.bulk_mode:
+            conn.execute("PRAGMA journal_mode=MEMORY")
+            conn.execute("PRAGMA synchronous=OFF")
+        else:
+            conn.execute("PRAGMA synchronous=NORMAL")
+
     def initialize_database(self):
         """Create database schema."""
         with self.get_connection() as conn:
+            if not self.bulk_mode:
+                self._enable_wal(conn)
+
             # Main instructions table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS instructions (
@@ -310,69 +417,91 @@ class ISADatabase:
                 ON architectures(isa_name)
             """)
 
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_registers_architecture_id
-                ON architecture_registers(architecture_id)
-            """)
+            self._create_metadata_indexes(conn)
 
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_addressing_modes_architecture_id
-                ON architecture_addressing_modes(architecture_id)
-            """)
+            conn.commit()
 
-            # Additional indexes for new register fields
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_registers_parent_id
-                ON architecture_registers(parent_register_id)
-            """)
+    def _enable_wal(self, conn: sqlite3.Connection) -> None:
+        """Switch the database to WAL journaling where it can be written."""
+        # WAL persists in the database file, so it only needs setting once.
+        # It also needs -wal/-shm files next to the database, so read-only
+        # files and directories keep their existing journal mode
+        if not os.access(self.db_path.parent, os.W_OK):
+            return
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError:
+            pass
 
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_registers_purpose
-                ON architecture_registers(register_purpose)
-            """)
+    def _drop_metadata_indexes(self, conn: sqlite3.Connection) -> None:
+        """Drop metadata indexes on an open connection without committing."""
+        for index_name, _ in _METADATA_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {index_name}")
 
-            conn.commit()
+    def _create_metadata_indexes(self, conn: sqlite3.Connection) -> None:
+        """Create metadata indexes on an open connection without committing."""
+        for index_name, target in _METADATA_INDEXES:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {target}")
 
     def insert_instruction(self, instruction: InstructionRecord) -> int:
         """Insert instruction into database."""
         with self.get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT OR REPLACE INTO instructions (
-                    isa, mnemonic, variant, category, extension, isa_set,
-                    description, syntax, operands_json, encoding_json,
-                    flags_affected_json, cpuid_features_json, attributes_json,
-                    cpl, added_version, deprecated
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    instruction.isa,
-                    instruction.mnemonic,
-                    instruction.variant,
-                    instruction.category,
-                    instruction.extension,
-                    instruction.isa_set,
-                    instruction.description,
-                    instruction.syntax,
-                    json.dumps(
-                        [asdict(op) for op in instruction.operands]
-                        if instruction.operands
-                        else []
-                    ),
-                    json.dumps(
-                        asdict(instruction.encoding) if instruction.encoding else None
-                    ),
-                    json.dumps(instruction.flags_affected),
-                    json.dumps(instruction.cpuid_features),
-                    json.dumps(instruction.attributes),
-                    instruction.cpl,
-                    instruction.added_version,
-                    instruction.deprecated,
-                ),
+                _INSERT_INSTRUCTION_SQL, self._instruction_params(instruction)
             )
             conn.commit()
             return cursor.lastrowid
 
+    def insert_instructions(self, instructions: List[InstructionRecord]) -> int:
+        """Insert many instructions in a single transaction."""
+        if not instructions:
+            return 0
+
+        params = [self._instruction_params(i) for i in instructions]
+        with self.get_connection() as conn:
+            cursor = conn.executemany(_INSERT_INSTRUCTION_SQL, params)
+            conn.commit()
+            return cursor.rowcount
+
+    def _instruction_params(self, instruction: InstructionRecord) -> tuple:
+        """Build the INSERT parameters for an instruction."""
+        return (
+            instruction.isa,
+            instruction.mnemonic,
+            instruction.variant,
+            instruction.category,
+            instruction.extension,
+            instruction.isa_set,
+            instruction.description,
+            instruction.syntax,
+            (
+                _dump_json(
+                    [
+                        {name: getattr(op, name) for name in _OPERAND_FIELDS}
+                        for op in instruction.operands
+                    ]
+                )
+                if instruction.operands
+                else _EMPTY_JSON_ARRAY
+            ),
+            (
+                _dump_json(
+                    {
+                        name: getattr(instruction.encoding, name)
+                        for name in _ENCODING_FIELDS
+                    }
+                )
+                if instruction.encoding
+                else _JSON_NULL
+            ),
+            _dump_json_list(instruction.flags_affected),
+            _dump_json_list(instruction.cpuid_features),
+            _dump_json_list(instruction.attributes),
+            instruction.cpl,
+            instruction.added_version,
+            instruction.deprecated,
+        )
+
     def get_instruction(
         self, isa: str, mnemonic: str, variant: Optional[str] = None
     ) -> Optional[InstructionRecord]:
@@ -575,11 +704,7 @@ class ISADatabase:
         """Insert architecture metadata into database."""
         with self.get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT OR REPLACE INTO architectures (
-                    isa_name, word_size, endianness, description, machine_mode
-                ) VALUES (?, ?, ?, ?, ?)
-                """,
+                _INSERT_ARCHITECTURE_SQL,
                 (
                     architecture.isa_name,
                     architecture.word_size,
@@ -591,17 +716,38 @@ class ISADatabase:
             conn.commit()
             return cursor.lastrowid
 
+    def insert_architectures(
+        self, architectures: List[ArchitectureRecord]
+    ) -> Dict[str, int]:
+        """Insert architectures in one statement and return IDs by ISA name."""
+        if not architectures:
+            return {}
+
+        params = [
+            value
+            for architecture in architectures
+            for value in (
+                architecture.isa_name,
+                architecture.word_size,
+                architecture.endianness,
+                architecture.description,
+                architecture.machine_mode,
+            )
+        ]
+        # RETURNING row order is unspecified, so pair each ID with its name
+        sql = _INSERT_ARCHITECTURES_RETURNING_SQL.format(
+            values=", ".join(["(?, ?, ?, ?, ?)"] * len(architectures))
+        )
+        with self.get_connection() as conn:
+            arch_ids = dict(conn.execute(sql, params).fetchall())
+            conn.commit()
+            return arch_ids
+
     def insert_register(self, register: RegisterRecord) -> int:
         """Insert register into database."""
         with self.get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT OR REPLACE INTO architecture_registers (
-                    architecture_id, register_name, register_class, width_bits,
-                    encoding_id, is_main_register, parent_register_id, aliases_json,
-                    calling_convention_preserved, register_purpose
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _INSERT_REGISTER_SQL,
                 (
                     register.architecture_id,
                     register.register_name,
@@ -622,11 +768,7 @@ class ISADatabase:
         """Insert addressing mode into database."""
         with self.get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT OR REPLACE INTO architecture_addressing_modes (
-                    architecture_id, mode_name, description, example_syntax
-                ) VALUES (?, ?, ?, ?)
-                """,
+                _INSERT_ADDRESSING_MODE_SQL,
                 (
                     addressing_mode.architecture_id,
                     addressing_mode.mode_name,
@@ -637,6 +779,67 @@ class ISADatabase:
             conn.commit()
             return cursor.lastrowid
 
+    def insert_architecture_metadata(
+        self,
+        registers: List[RegisterRecord],
+        addressing_modes: List[AddressingModeRecord],
+    ) -> None:
+        """Insert registers and addressing modes in a single transaction."""
+        with self.get_connection() as conn:
+            # sqlite3 only opens its implicit transaction before DML, so begin
+            # explicitly to keep the index drops from autocommitting; a failed
+            # insert then rolls back to the original indexes on close
+            conn.execute("BEGIN")
+            # Build the indexes once over the loaded rows instead of updating
+            # them row by row during the inserts
+            self._drop_metadata_indexes(conn)
+            self._insert_registers(conn, registers)
+            self._insert_addressing_modes(conn, addressing_modes)
+            self._create_metadata_indexes(conn)
+            conn.commit()
+
+    def _insert_registers(
+        self, conn: sqlite3.Connection, registers: List[RegisterRecord]
+    ) -> int:
+        """Insert registers on an open connection without committing."""
+        cursor = conn.executemany(
+            _INSERT_REGISTER_SQL,
+            [
+                (
+                    register.architecture_id,
+                    register.register_name,
+                    register.register_class,
+                    register.width_bits,
+                    register.encoding_id,
+                    register.is_main_register,
+                    register.parent_register_id,
+                    register.aliases_json,
+                    register.calling_convention_preserved,
+                    register.register_purpose,
+                )
+                for register in registers
+            ],
+        )
+        return cursor.rowcount
+
+    def _insert_addressing_modes(
+        self, conn: sqlite3.Connection, addressing_modes: List[AddressingModeRecord]
+    ) -> int:
+        """Insert addressing modes on an open connection without committing."""
+        cursor = conn.executemany(
+            _INSERT_ADDRESSING_MODE_SQL,
+            [
+                (
+                    mode.architecture_id,
+                    mode.mode_name,
+                    mode.description,
+                    mode.example_syntax,
+                )
+                for mode in addressing_modes
+            ],
+        )
+        return cursor.rowcount
+
     def get_architecture(self, isa_name: str) -> Optional[ArchitectureRecord]:
         """Get architecture by ISA name."""
         with self.get_connection() as conn:
@@ -0,0 +1,23 @@
+"""Logging and console helpers shared by the command-line scripts."""
+
+import logging
+import logging.handlers
+import sys
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def buffered_file_handler(filename: str) -> logging.Handler:
+    """Create a log file handler that batches writes to disk."""
+    file_handler = logging.FileHandler(filename)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    # Records are flushed every 1000 entries, on errors and at exit
+    return logging.handlers.MemoryHandler(
+        capacity=1000, flushLevel=logging.ERROR, target=file_handler
+    )
+
+
+def configure_stdout():
+    """Write console output as UTF-8 regardless of the platform code page."""
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
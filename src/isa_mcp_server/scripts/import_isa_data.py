@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 ISA Data Import Script
 
@@ -6,9 +5,9 @@ This script imports instruction set architecture data from various sources
 into a unified SQLite database for use by the MCP server.
 
 Usage:
-    python import_isa_data.py --all
-    python import_isa_data.py --intel --source-dir External/xed
-    python import_isa_data.py --arm --source-dir /path/to/arm/docs
+    isa-import --all
+    isa-import --intel --source-dir External/xed
+    isa-import --arm --source-dir /path/to/arm/docs
 """
 
 import argparse
@@ -16,14 +15,12 @@ import asyncio
 import logging
 import sys
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
-# Add src to path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from isa_mcp_server.importers.arm_importer import ARMImporter
-from isa_mcp_server.importers.xed_importer import XEDImporter
-from isa_mcp_server.isa_database import ISADatabase
+from ..importers.arm_importer import ARMImporter
+from ..importers.xed_importer import XEDImporter
+from ..isa_database import ISADatabase
+from ._logging import LOG_FORMAT, buffered_file_handler, configure_stdout
 
 
 def setup_logging(verbose: bool = False):
@@ -31,21 +28,28 @@ def setup_logging(verbose: bool = False):
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        format=LOG_FORMAT,
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler("import_isa_data.log"),
+            buffered_file_handler("import_isa_data.log"),
         ],
+        force=True,
     )
 
 
 async def import_intel_data(
-    db: ISADatabase, source_dir: Path, skip_metadata: bool = False
+    db: ISADatabase,
+    source_dir: Path,
+    skip_metadata: bool = False,
+    parse_cache_dir: Optional[Path] = None,
+    parse_workers: Optional[int] = None,
 ) -> Dict:
     """Import Intel x86_32 and x86_64 data from XED."""
     logging.info(f"Importing Intel x86_32 and x86_64 data from {source_dir}")
 
-    importer = XEDImporter(db)
+    importer = XEDImporter(
+        db, parse_cache_dir=parse_cache_dir, parse_workers=parse_workers
+    )
     result = await importer.import_from_source(source_dir, skip_metadata=skip_metadata)
 
     if result["success"]:
@@ -90,9 +94,10 @@ async def import_arm_data(
     return result
 
 
-async def main():
-    """Main entry point."""
+async def async_main():
+    """Run the import."""
     parser = argparse.ArgumentParser(
+        prog="isa-import",
         description="Import ISA instruction data into database",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -102,6 +107,7 @@ Examples:
   %(prog)s --intel --skip-metadata                 # Import Intel instructions only
   %(prog)s --arm --source-dir /path/to/arm         # Import ARM AArch64
   %(prog)s --intel --db-path custom.db             # Use custom database path
+  %(prog)s --intel --parse-cache-dir ~/.cache/isa-mcp  # Reuse parsed XED data
         """,
     )
 
@@ -148,6 +154,20 @@ Examples:
         help="Source directory for ARM data (default: External/arm-machine-readable)",
     )
 
+    parser.add_argument(
+        "--parse-cache-dir",
+        type=Path,
+        help="Directory for cached parsed XED data, reused while sources are "
+        "unchanged (e.g. ~/.cache/isa-mcp; default: no cache)",
+    )
+
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        help="Number of processes parsing XED files in parallel "
+        "(default: parse in the importing process)",
+    )
+
     # Logging options
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
@@ -178,7 +198,7 @@ Examples:
         )
 
     # Initialize database
-    db = ISADatabase(args.db_path)
+    db = ISADatabase(args.db_path, bulk_mode=True)
 
     if args.recreate_db:
         if Path(args.db_path).exists():
@@ -192,6 +212,9 @@ Examples:
     results = {}
     overall_success = True
 
+    # Collect imports so independent ISAs can run concurrently
+    tasks = {}
+
     # Import Intel x86
     if args.all or args.intel:
         source_dir = args.source_dir or args.intel_source_dir
@@ -199,24 +222,33 @@ Examples:
             logging.error(f"Intel source directory not found: {source_dir}")
             overall_success = False
         else:
-            results["intel"] = await import_intel_data(
-                db, source_dir, skip_metadata=args.skip_metadata
+            tasks["intel"] = import_intel_data(
+                db,
+                source_dir,
+                skip_metadata=args.skip_metadata,
+                parse_cache_dir=args.parse_cache_dir,
+                parse_workers=args.parse_workers,
             )
-            if not results["intel"]["success"]:
-                overall_success = False
 
-    # Import ARM (future)
+    # Import ARM
     if args.all or args.arm:
         source_dir = args.source_dir or args.arm_source_dir
         if not source_dir or not source_dir.exists():
             logging.error(f"ARM source directory not found: {source_dir}")
             overall_success = False
         else:
-            results["arm"] = await import_arm_data(
+            tasks["arm"] = import_arm_data(
                 db, source_dir, skip_metadata=args.skip_metadata
             )
-            if not results["arm"]["success"]:
-                overall_success = False
+
+    task_results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    for isa, result in zip(tasks.keys(), task_results):
+        if isinstance(result, BaseException):
+            logging.error(f"{isa} import raised an exception: {result}")
+            result = {"success": False, "error": str(result)}
+        results[isa] = result
+        if not result["success"]:
+            overall_success = False
 
     # Print summary
     if not args.quiet:
@@ -228,8 +260,8 @@ Examples:
         total_time = 0
 
         for isa, result in results.items():
-            status = "✓" if result["success"] else "✗"
-            print(f"{status} {isa.upper():<8}: ", end="")
+            status = "[OK]" if result["success"] else "[FAIL]"
+            print(f"{status:<6} {isa.upper():<8}: ", end="")
 
             if result["success"]:
                 instructions = result["stats"]["instructions_inserted"]
@@ -245,13 +277,19 @@ Examples:
         print(f"Database: {args.db_path}")
 
         if overall_success:
-            print("\n🎉 Import completed successfully!")
+            print("\nImport completed successfully!")
         else:
-            print("\n❌ Import completed with errors")
+            print("\nImport completed with errors")
 
     # Set exit code
     sys.exit(0 if overall_success else 1)
 
 
+def main():
+    """Main entry point."""
+    configure_stdout()
+    asyncio.run(async_main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
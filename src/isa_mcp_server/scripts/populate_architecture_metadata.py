@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 Architecture Metadata Population Script
 
@@ -7,8 +6,7 @@ from XED datafiles. It should be run after the initial instruction import
 to add architecture specifications.
 
 Usage:
-    python populate_architecture_metadata.py [--db-path isa_docs.db]
-        [--xed-dir External/xed]
+    isa-populate-metadata [--db-path isa_docs.db] [--xed-dir External/xed]
 """
 
 import argparse
@@ -16,11 +14,9 @@ import logging
 import sys
 from pathlib import Path
 
-# Add src to path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from isa_mcp_server.isa_database import ISADatabase
-from isa_mcp_server.xed_metadata_parser import XEDMetadataParser
+from ..isa_database import ISADatabase
+from ..xed_metadata_parser import XEDMetadataParser
+from ._logging import LOG_FORMAT, buffered_file_handler, configure_stdout
 
 
 def setup_logging(verbose: bool = False):
@@ -28,11 +24,12 @@ def setup_logging(verbose: bool = False):
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        format=LOG_FORMAT,
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler("populate_architecture_metadata.log"),
+            buffered_file_handler("populate_architecture_metadata.log"),
         ],
+        force=True,
     )
 
 
@@ -48,49 +45,36 @@ def populate_architecture_metadata(db: ISADatabase, xed_dir: Path) -> bool:
         logging.info("Parsing architecture specifications...")
         architectures = parser.parse_architectures()
 
+        # Insert architectures first so their IDs can be assigned while
+        # registers and addressing modes are constructed
+        logging.info("Inserting architecture specifications...")
+        arch_ids = db.insert_architectures(architectures)
+        logging.info(f"Inserted {len(arch_ids)} architectures")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            for isa_name, arch_id in arch_ids.items():
+                logging.debug("Inserted architecture: %s (ID: %d)", isa_name, arch_id)
+
         # Parse registers
         logging.info("Parsing register definitions...")
-        x86_32_registers, x86_64_registers = parser.parse_registers()
+        x86_32_registers, x86_64_registers = parser.parse_registers(
+            arch_ids["x86_32"], arch_ids["x86_64"]
+        )
 
         # Parse addressing modes
         logging.info("Parsing addressing modes...")
-        x86_32_modes, x86_64_modes = parser.parse_addressing_modes()
-
-        # Insert architectures
-        logging.info("Inserting architecture specifications...")
-        arch_ids = {}
-        for arch in architectures:
-            arch_id = db.insert_architecture(arch)
-            arch_ids[arch.isa_name] = arch_id
-            logging.info(f"Inserted architecture: {arch.isa_name} (ID: {arch_id})")
+        x86_32_modes, x86_64_modes = parser.parse_addressing_modes(
+            arch_ids["x86_32"], arch_ids["x86_64"]
+        )
 
-        # Insert registers
-        logging.info("Inserting register definitions...")
-
-        # Update architecture IDs for registers
-        for reg in x86_32_registers:
-            reg.architecture_id = arch_ids["x86_32"]
-            db.insert_register(reg)
-
-        for reg in x86_64_registers:
-            reg.architecture_id = arch_ids["x86_64"]
-            db.insert_register(reg)
+        # Insert registers and addressing modes in one transaction
+        logging.info("Inserting register definitions and addressing modes...")
+        db.insert_architecture_metadata(
+            x86_32_registers + x86_64_registers, x86_32_modes + x86_64_modes
+        )
 
         logging.info(f"Inserted {len(x86_32_registers)} x86_32 registers")
         logging.info(f"Inserted {len(x86_64_registers)} x86_64 registers")
 
-        # Insert addressing modes
-        logging.info("Inserting addressing modes...")
-
-        # Update architecture IDs for addressing modes
-        for mode in x86_32_modes:
-            mode.architecture_id = arch_ids["x86_32"]
-            db.insert_addressing_mode(mode)
-
-        for mode in x86_64_modes:
-            mode.architecture_id = arch_ids["x86_64"]
-            db.insert_addressing_mode(mode)
-
         logging.info(f"Inserted {len(x86_32_modes)} x86_32 addressing modes")
         logging.info(f"Inserted {len(x86_64_modes)} x86_64 addressing modes")
 
@@ -122,7 +106,9 @@ def populate_architecture_metadata(db: ISADatabase, xed_dir: Path) -> bool:
 
 def main():
     """Main entry point."""
+    configure_stdout()
     parser = argparse.ArgumentParser(
+        prog="isa-populate-metadata",
         description="Populate architecture metadata from XED datafiles",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -172,7 +158,7 @@ Examples:
         sys.exit(1)
 
     # Initialize database
-    db = ISADatabase(args.db_path)
+    db = ISADatabase(args.db_path, bulk_mode=True)
 
     # Ensure database schema is up to date
     logging.info("Initializing database schema...")
@@ -192,7 +178,7 @@ Examples:
     success = populate_architecture_metadata(db, args.xed_dir)
 
     if success:
-        print("✓ Architecture metadata population completed successfully!")
+        print("[OK] Architecture metadata population completed successfully!")
 
         # Print summary
         print("\n" + "=" * 50)
@@ -221,7 +207,7 @@ Examples:
 
         sys.exit(0)
     else:
-        print("✗ Architecture metadata population failed. Check logs for details.")
+        print("[FAIL] Architecture metadata population failed. Check logs for details.")
         sys.exit(1)
 
 
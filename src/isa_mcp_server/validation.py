@@ -1,5 +1,6 @@
 """Database path validation and security functions."""
 
+import asyncio
 import os
 import sqlite3
 from pathlib import Path
@@ -119,6 +120,27 @@ def validate_db_path(db_path: Union[str, Path]) -> Path:
     return path
 
 
+async def validate_db_path_async(db_path: Union[str, Path]) -> Path:
+    """
+    Validate database path without blocking the event loop.
+
+    Runs validate_db_path in a worker thread, since the permission and
+    integrity checks perform blocking file and SQLite I/O.
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        Path: Validated and normalized path
+
+    Raises:
+        DatabasePathError: If path is invalid or insecure
+        DatabasePermissionError: If file permissions are insufficient
+        DatabaseIntegrityError: If database format is invalid
+    """
+    return await asyncio.to_thread(validate_db_path, db_path)
+
+
 def _is_system_path(path: Path) -> bool:
     """Check if path is in a system directory that should be protected."""
     # Use lowercase for case-insensitive comparison on all platforms
@@ -2,12 +2,55 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 from .isa_database import AddressingModeRecord, ArchitectureRecord, RegisterRecord
 
 logger = logging.getLogger(__name__)
 
+# Register classes available in 64-bit and 32-bit mode regardless of name
+_X86_64_REGISTER_CLASSES = frozenset(
+    {"sr", "cr", "dr", "mmx", "x87", "xmm", "ymm", "zmm"}
+)
+_X86_32_REGISTER_CLASSES = frozenset({"sr", "cr", "dr", "mmx", "x87", "xmm"})
+
+# Legacy 16-bit and 8-bit general purpose registers (no REX prefix needed)
+_LEGACY_GPR16_NAMES = frozenset({"AX", "BX", "CX", "DX", "SP", "BP", "SI", "DI"})
+_LEGACY_GPR8_NAMES = frozenset({"AL", "BL", "CL", "DL", "AH", "BH", "CH", "DH"})
+# 32-bit general purpose registers of 32-bit mode
+_X86_32_GPR32_NAMES = frozenset("E" + name for name in _LEGACY_GPR16_NAMES)
+
+# Numbered general purpose registers R8-R31 (R16-R31 are APX) and their
+# 32/16/8-bit forms; none of them exist in 32-bit mode
+_NUMBERED_GPR_NUMBERS = range(8, 32)
+_NUMBERED_GPR32_NAMES = frozenset(f"R{i}D" for i in _NUMBERED_GPR_NUMBERS)
+_NUMBERED_GPR16_NAMES = frozenset(f"R{i}W" for i in _NUMBERED_GPR_NUMBERS)
+_NUMBERED_GPR8_NAMES = frozenset(f"R{i}B" for i in _NUMBERED_GPR_NUMBERS)
+_NUMBERED_GPR_NAMES = (
+    frozenset(f"R{i}" for i in _NUMBERED_GPR_NUMBERS)
+    | _NUMBERED_GPR32_NAMES
+    | _NUMBERED_GPR16_NAMES
+    | _NUMBERED_GPR8_NAMES
+)
+
+# 32/16/8-bit general purpose registers of 64-bit mode
+_GPR32_NAMES = (
+    _X86_32_GPR32_NAMES
+    | {"R" + name for name in _LEGACY_GPR16_NAMES}
+    | _NUMBERED_GPR32_NAMES
+)
+_GPR16_NAMES = _LEGACY_GPR16_NAMES | _NUMBERED_GPR16_NAMES
+_GPR8_NAMES = _LEGACY_GPR8_NAMES | {"SPL", "BPL", "SIL", "DIL"} | _NUMBERED_GPR8_NAMES
+
+# Main (not sub-register) registers per class
+_MAIN_GPR64_NAMES = frozenset(
+    ["R" + name for name in _LEGACY_GPR16_NAMES] + [f"R{i}" for i in range(8, 16)]
+)
+_MAIN_FLAGS_NAMES = frozenset({"EFLAGS", "RFLAGS"})
+_MAIN_CONTROL_DEBUG_NAMES = frozenset(
+    {"CR0", "CR2", "CR3", "CR4", "DR0", "DR1", "DR2", "DR3", "DR6", "DR7"}
+)
+
 
 class XEDMetadataParser:
     """Parser for XED datafiles to extract architecture metadata."""
@@ -45,7 +88,9 @@ class XEDMetadataParser:
 
         return architectures
 
-    def parse_registers(self) -> Tuple[List[RegisterRecord], List[RegisterRecord]]:
+    def parse_registers(
+        self, x86_32_arch_id: int = 1, x86_64_arch_id: int = 2
+    ) -> Tuple[List[RegisterRecord], List[RegisterRecord]]:
         """Parse registers from xed-regs.txt and categorize by architecture."""
         if not self.registers_file.exists():
             raise FileNotFoundError(f"Register file not found: {self.registers_file}")
@@ -53,24 +98,19 @@ class XEDMetadataParser:
         x86_32_registers = []
         x86_64_registers = []
 
-        try:
-            with open(self.registers_file, "r") as f:
-                lines = f.readlines()
-        except Exception as e:
-            raise RuntimeError(f"Failed to read register file: {e}")
-
-        for line_num, line in enumerate(lines, 1):
+        for line_num, line in enumerate(self._read_register_lines(), 1):
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
 
             # Parse register definition
             # Format: name class width max-enclosing-reg-64b/32b-mode regid [h]
-            parts = line.split()
+            # Only the first five fields are used, so stop splitting after them
+            parts = line.split(None, 5)
             if len(parts) < 3:
                 # Log warning but continue processing
                 logger.warning(
-                    f"Malformed register definition at line {line_num}: {line}"
+                    "Malformed register definition at line %d: %s", line_num, line
                 )
                 continue
 
@@ -82,7 +122,7 @@ class XEDMetadataParser:
                 # Validate register name
                 if not reg_name or not reg_name.replace("_", "").isalnum():
                     logger.warning(
-                        f"Invalid register name at line {line_num}: {reg_name}"
+                        "Invalid register name at line %d: %s", line_num, reg_name
                     )
                     continue
 
@@ -102,8 +142,9 @@ class XEDMetadataParser:
                 if width_str == "NA":
                     # Skip registers with undefined width
                     logger.warning(
-                        f"Skipping register with undefined width at line "
-                        f"{line_num}: {reg_name}"
+                        "Skipping register with undefined width at line %d: %s",
+                        line_num,
+                        reg_name,
                     )
                     continue
 
@@ -114,19 +155,20 @@ class XEDMetadataParser:
                         width = int(width_str)
                 except ValueError:
                     logger.warning(
-                        f"Failed to parse register width at line "
-                        f"{line_num}: {width_str}"
+                        "Failed to parse register width at line %d: %s",
+                        line_num,
+                        width_str,
                     )
                     continue
 
                 if width <= 0 or width > 512:  # Sanity check for register width
                     logger.warning(
-                        f"Invalid register width at line {line_num}: {width}"
+                        "Invalid register width at line %d: %d", line_num, width
                     )
                     continue
 
             except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse register at line {line_num}: {e}")
+                logger.warning("Failed to parse register at line %d: %s", line_num, e)
                 continue
 
             # Determine architecture availability
@@ -138,7 +180,7 @@ class XEDMetadataParser:
             if is_32bit_reg:
                 x86_32_registers.append(
                     RegisterRecord(
-                        architecture_id=1,  # Will be set properly when inserting
+                        architecture_id=x86_32_arch_id,
                         register_name=reg_name,
                         register_class=reg_class,
                         width_bits=width,
@@ -151,7 +193,7 @@ class XEDMetadataParser:
             if is_64bit_reg:
                 x86_64_registers.append(
                     RegisterRecord(
-                        architecture_id=2,  # Will be set properly when inserting
+                        architecture_id=x86_64_arch_id,
                         register_name=reg_name,
                         register_class=reg_class,
                         width_bits=width,
@@ -162,6 +204,14 @@ class XEDMetadataParser:
 
         return x86_32_registers, x86_64_registers
 
+    def _read_register_lines(self) -> Iterator[str]:
+        """Stream the lines of xed-regs.txt, reporting read errors uniformly."""
+        try:
+            with open(self.registers_file, "r") as f:
+                yield from f
+        except Exception as e:
+            raise RuntimeError(f"Failed to read register file: {e}")
+
     def _is_64bit_register(self, reg_name: str, reg_class: str, width: int) -> bool:
         """Determine if register is available in 64-bit mode."""
         # All 64-bit registers
@@ -173,54 +223,23 @@ class XEDMetadataParser:
             return True
 
         # All segment, control, debug, MMX, x87, XMM, YMM, ZMM registers
-        if reg_class in ["sr", "cr", "dr", "mmx", "x87", "xmm", "ymm", "zmm"]:
+        if reg_class in _X86_64_REGISTER_CLASSES:
             return True
 
-        # 32-bit versions of 64-bit registers (EAX, EBX, etc.)
-        if reg_class == "gpr" and width == 32:
-            if reg_name.startswith(("E", "R")) and reg_name[1:] in [
-                "AX",
-                "BX",
-                "CX",
-                "DX",
-                "SP",
-                "BP",
-                "SI",
-                "DI",
-            ]:
-                return True
-            # R8D, R9D, etc.
-            if reg_name.startswith("R") and reg_name[1:].replace("D", "").isdigit():
-                return True
+        if reg_class != "gpr":
+            return False
 
-        # 16-bit versions
-        if reg_class == "gpr" and width == 16:
-            if reg_name in ["AX", "BX", "CX", "DX", "SP", "BP", "SI", "DI"]:
-                return True
-            # R8W, R9W, etc.
-            if reg_name.startswith("R") and reg_name[1:].replace("W", "").isdigit():
-                return True
-
-        # 8-bit versions
-        if reg_class == "gpr" and width == 8:
-            if reg_name in [
-                "AL",
-                "BL",
-                "CL",
-                "DL",
-                "AH",
-                "BH",
-                "CH",
-                "DH",
-                "SPL",
-                "BPL",
-                "SIL",
-                "DIL",
-            ]:
-                return True
-            # R8B, R9B, etc.
-            if reg_name.startswith("R") and reg_name[1:].replace("B", "").isdigit():
-                return True
+        # 32-bit versions of 64-bit registers (EAX, R8D, etc.)
+        if width == 32:
+            return reg_name in _GPR32_NAMES
+
+        # 16-bit versions (AX, R8W, etc.)
+        if width == 16:
+            return reg_name in _GPR16_NAMES
+
+        # 8-bit versions (AL, SPL, R8B, etc.)
+        if width == 8:
+            return reg_name in _GPR8_NAMES
 
         return False
 
@@ -230,43 +249,32 @@ class XEDMetadataParser:
         if width == 64:
             return False
 
-        # No R8-R15 registers in 32-bit mode
-        if reg_name.startswith("R") and len(reg_name) > 2:
-            reg_num = reg_name[1:].replace("D", "").replace("W", "").replace("B", "")
-            if reg_num.isdigit() and int(reg_num) >= 8:
-                return False
+        # No R8-R31 registers in 32-bit mode
+        if reg_name in _NUMBERED_GPR_NAMES:
+            return False
 
         # 32-bit flags register
         if reg_name == "EFLAGS":
             return True
 
         # All segment, control, debug, MMX, x87, XMM registers
-        if reg_class in ["sr", "cr", "dr", "mmx", "x87", "xmm"]:
+        if reg_class in _X86_32_REGISTER_CLASSES:
             return True
 
+        if reg_class != "gpr":
+            return False
+
         # 32-bit general purpose registers
-        if reg_class == "gpr" and width == 32:
-            if reg_name.startswith("E") and reg_name[1:] in [
-                "AX",
-                "BX",
-                "CX",
-                "DX",
-                "SP",
-                "BP",
-                "SI",
-                "DI",
-            ]:
-                return True
+        if width == 32:
+            return reg_name in _X86_32_GPR32_NAMES
 
         # 16-bit versions
-        if reg_class == "gpr" and width == 16:
-            if reg_name in ["AX", "BX", "CX", "DX", "SP", "BP", "SI", "DI"]:
-                return True
+        if width == 16:
+            return reg_name in _LEGACY_GPR16_NAMES
 
         # 8-bit versions (but not REX-only ones)
-        if reg_class == "gpr" and width == 8:
-            if reg_name in ["AL", "BL", "CL", "DL", "AH", "BH", "CH", "DH"]:
-                return True
+        if width == 8:
+            return reg_name in _LEGACY_GPR8_NAMES
 
         return False
 
@@ -277,109 +285,88 @@ class XEDMetadataParser:
             # 64-bit registers are main in 64-bit mode, but only the basic ones
             if width == 64:
                 # Only RAX, RBX, RCX, RDX, RSP, RBP, RSI, RDI, R8-R15
-                if reg_name in ["RAX", "RBX", "RCX", "RDX", "RSP", "RBP", "RSI", "RDI"]:
-                    return True
-                if reg_name.startswith("R") and len(reg_name) <= 3:
-                    reg_num = reg_name[1:]
-                    if reg_num.isdigit() and 8 <= int(reg_num) <= 15:
-                        return True
-                return False
+                return reg_name in _MAIN_GPR64_NAMES
 
             # 32-bit registers are main in 32-bit mode for basic registers only
             if width == 32:
-                if reg_name in ["EAX", "EBX", "ECX", "EDX", "ESP", "EBP", "ESI", "EDI"]:
-                    return True
-                return False
+                return reg_name in _X86_32_GPR32_NAMES
+
+            return False
 
         # For flags registers, only the main ones
         if reg_class == "flags":
-            if reg_name in ["EFLAGS", "RFLAGS"]:
-                return True
+            return reg_name in _MAIN_FLAGS_NAMES
 
         # For segment registers, all are considered main
         if reg_class == "sr":
             return True
 
         # For control and debug registers, only a few main ones
-        if reg_class in ["cr", "dr"]:
-            control_debug_regs = [
-                "CR0",
-                "CR2",
-                "CR3",
-                "CR4",
-                "DR0",
-                "DR1",
-                "DR2",
-                "DR3",
-                "DR6",
-                "DR7",
-            ]
-            if reg_name in control_debug_regs:
-                return True
+        if reg_class in ("cr", "dr"):
+            return reg_name in _MAIN_CONTROL_DEBUG_NAMES
 
         # For SIMD registers, consider the main ones
         if reg_class == "xmm":
-            if reg_name.startswith("XMM") and len(reg_name) <= 5:  # XMM0-XMM15
-                return True
+            return reg_name.startswith("XMM") and len(reg_name) <= 5  # XMM0-XMM15
 
         return False
 
     def parse_addressing_modes(
-        self,
+        self, x86_32_arch_id: int = 1, x86_64_arch_id: int = 2
     ) -> Tuple[List[AddressingModeRecord], List[AddressingModeRecord]]:
         """Parse addressing modes for x86_32 and x86_64."""
         # x86_32 addressing modes
         x86_32_modes = [
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=x86_32_arch_id,
                 mode_name="register_direct",
                 description="Direct register addressing",
                 example_syntax="MOV EAX, EBX",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=x86_32_arch_id,
                 mode_name="immediate",
                 description="Immediate addressing",
                 example_syntax="MOV EAX, 42",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=x86_32_arch_id,
                 mode_name="memory_direct",
                 description="Direct memory addressing",
                 example_syntax="MOV EAX, [0x12345678]",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=x86_32_arch_id,
                 mode_name="register_indirect",
                 description="Register indirect addressing",
                 example_syntax="MOV EAX, [EBX]",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=x86_32_arch_id,
                 mode_name="base_displacement",
                 description="Base plus displacement addressing",
                 example_syntax="MOV EAX, [EBX+8]",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=x86_32_arch_id,
                 mode_name="index_scale",
                 description="Index with scale addressing",
                 example_syntax="MOV EAX, [ESI*2]",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=x86_32_arch_id,
                 mode_name="base_index",
                 description="Base plus index addressing",
                 example_syntax="MOV EAX, [EBX+ESI]",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=x86_32_arch_id,
                 mode_name="base_index_displacement",
                 description="Base plus index plus displacement addressing",
                 example_syntax="MOV EAX, [EBX+ESI+8]",
             ),
             AddressingModeRecord(
-                architecture_id=1,
+                architecture_id=x86_32_arch_id,
                 mode_name="base_index_scale_displacement",
                 description="Base plus scaled index plus displacement addressing",
                 example_syntax="MOV EAX, [EBX+ESI*2+8]",
@@ -389,61 +376,61 @@ class XEDMetadataParser:
         # x86_64 addressing modes (includes all x86_32 modes plus RIP-relative)
         x86_64_modes = [
             AddressingModeRecord(
-                architecture_id=2,
+                architecture_id=x86_64_arch_id,
                 mode_name="register_direct",
                 description="Direct register addressing",
                 example_syntax="MOV RAX, RBX",
             ),
             AddressingModeRecord(
-                architecture_id=2,
+                architecture_id=x86_64_arch_id,
                 mode_name="immediate",
                 description="Immediate addressing",
                 example_syntax="MOV RAX, 42",
             ),
             AddressingModeRecord(
-                architecture_id=2,
+                architecture_id=x86_64_arch_id,
                 mode_name="memory_direct",
                 description="Direct memory addressing",
                 example_syntax="MOV RAX, [0x12345678]",
             ),
             AddressingModeRecord(
-                architecture_id=2,
+                architecture_id=x86_64_arch_id,
                 mode_name="register_indirect",
                 description="Register indirect addressing",
                 example_syntax="MOV RAX, [RBX]",
             ),
             AddressingModeRecord(
-                architecture_id=2,
+                architecture_id=x86_64_arch_id,
                 mode_name="base_displacement",
                 description="Base plus displacement addressing",
                 example_syntax="MOV RAX, [RBX+8]",
             ),
             AddressingModeRecord(
-                architecture_id=2,
+                architecture_id=x86_64_arch_id,
                 mode_name="index_scale",
                 description="Index with scale addressing",
                 example_syntax="MOV RAX, [RSI*2]",
             ),
             AddressingModeRecord(
-                architecture_id=2,
+                architecture_id=x86_64_arch_id,
                 mode_name="base_index",
                 description="Base plus index addressing",
                 example_syntax="MOV RAX, [RBX+RSI]",
             ),
             AddressingModeRecord(
-                architecture_id=2,
+                architecture_id=x86_64_arch_id,
                 mode_name="base_index_displacement",
                 description="Base plus index plus displacement addressing",
                 example_syntax="MOV RAX, [RBX+RSI+8]",
             ),
             AddressingModeRecord(
-                architecture_id=2,
+                architecture_id=x86_64_arch_id,
                 mode_name="base_index_scale_displacement",
                 description="Base plus scaled index plus displacement addressing",
                 example_syntax="MOV RAX, [RBX+RSI*2+8]",
             ),
             AddressingModeRecord(
-                architecture_id=2,
+                architecture_id=x86_64_arch_id,
                 mode_name="rip_relative",
                 description="RIP-relative addressing (64-bit only)",
                 example_syntax="MOV RAX, [RIP+0x12345678]",
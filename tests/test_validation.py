@@ -12,6 +12,7 @@ from src.isa_mcp_server.validation import (
     DatabasePathError,
     DatabasePermissionError,
     validate_db_path,
+    validate_db_path_async,
 )
 
 
@@ -217,3 +218,28 @@ class TestValidateDbPath:
         except RuntimeError:
             # Skip test if home directory is not accessible
             pytest.skip("Home directory not accessible")
+
+
+class TestValidateDbPathAsync:
+    """Test async database path validation."""
+
+    @pytest.mark.asyncio
+    async def test_valid_path(self):
+        """Test async validation returns the resolved path."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = Path(tmp_dir) / "test.db"
+            with sqlite3.connect(str(db_path)) as conn:
+                conn.execute(
+                    "CREATE TABLE instructions (id INTEGER PRIMARY KEY, "
+                    "isa TEXT, mnemonic TEXT, description TEXT)"
+                )
+                conn.commit()
+
+            result = await validate_db_path_async(db_path)
+            assert result == db_path.resolve()
+
+    @pytest.mark.asyncio
+    async def test_invalid_path_raises(self):
+        """Test async validation propagates validation errors."""
+        with pytest.raises(DatabasePathError):
+            await validate_db_path_async("/etc/passwd")
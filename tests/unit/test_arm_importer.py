@@ -5,6 +5,8 @@ from unittest.mock import patch
 import pytest
 
 from src.isa_mcp_server.importers.arm_importer import ARMImporter
+from src.isa_mcp_server.importers.base import ISAImporterRegistry
+from src.isa_mcp_server.isa_database import InstructionRecord
 
 
 class TestARMImporter:
@@ -25,6 +27,34 @@ class TestARMImporter:
         version = importer.get_source_version(sample_arm_data_dir)
         assert version == "v9Ap6-A-2025-06_rel-83"
 
+    def test_metadata_parser_reused(self, temp_db, sample_arm_data_dir, tmp_path):
+        """Test one metadata parser is kept per source directory."""
+        importer = ARMImporter(temp_db)
+
+        parser = importer._get_metadata_parser(sample_arm_data_dir)
+
+        assert importer._get_metadata_parser(sample_arm_data_dir) is parser
+        assert importer._get_metadata_parser(tmp_path) is not parser
+
+    def test_validate_instruction(self, temp_db):
+        """Test validation passes complete records and logs why others fail."""
+        importer = ARMImporter(temp_db)
+        valid = InstructionRecord(
+            isa="aarch64", mnemonic="ADD", category="GENERAL", extension="BASE"
+        )
+        missing_category = InstructionRecord(
+            isa="aarch64", mnemonic="ADD", extension="BASE"
+        )
+
+        with patch.object(importer.logger, "warning") as mock_warning:
+            assert importer._validate_instruction(valid)
+            mock_warning.assert_not_called()
+
+            assert not importer._validate_instruction(missing_category)
+            mock_warning.assert_called_once_with(
+                "Instruction %s missing category", "ADD"
+            )
+
     def test_get_source_version_error(self, temp_db, tmp_path):
         """Test source version when data is invalid."""
         importer = ARMImporter(temp_db)
@@ -59,6 +89,18 @@ class TestARMImporter:
         assert instruction.isa == "aarch64"
         assert instruction.mnemonic == "ADD"
 
+    @pytest.mark.asyncio
+    async def test_parse_source_batches(self, temp_db, sample_arm_data_dir):
+        """Test parsed records are grouped into lists of source_batch_size."""
+        importer = ARMImporter(temp_db)
+        instructions = [i async for i in importer.parse_sources(sample_arm_data_dir)]
+        importer.source_batch_size = 1
+
+        batches = [b async for b in importer.parse_source_batches(sample_arm_data_dir)]
+
+        assert [len(b) for b in batches] == [1] * len(instructions)
+        assert [b[0].mnemonic for b in batches] == [i.mnemonic for i in instructions]
+
     @pytest.mark.asyncio
     async def test_populate_architecture_metadata(self, temp_db, sample_arm_data_dir):
         """Test architecture metadata population."""
@@ -71,6 +113,33 @@ class TestARMImporter:
         # Check that data was inserted
         # This would require database queries to fully verify
 
+    @pytest.mark.asyncio
+    async def test_populate_architecture_metadata_batched(
+        self, temp_db, sample_arm_data_dir
+    ):
+        """Test registers and addressing modes are inserted in one batch."""
+        importer = ARMImporter(temp_db)
+
+        with (
+            patch.object(
+                temp_db, "insert_register", side_effect=AssertionError("per-row")
+            ),
+            patch.object(
+                temp_db, "insert_addressing_mode", side_effect=AssertionError("per-row")
+            ),
+            patch.object(
+                temp_db,
+                "insert_architecture_metadata",
+                wraps=temp_db.insert_architecture_metadata,
+            ) as mock_batch,
+        ):
+            success = await importer.populate_architecture_metadata(sample_arm_data_dir)
+
+        assert success
+        mock_batch.assert_called_once()
+        assert len(temp_db.get_architecture_registers("aarch64")) > 0
+        assert len(temp_db.get_architecture_addressing_modes("aarch64")) > 0
+
     @pytest.mark.asyncio
     async def test_populate_architecture_metadata_error(self, temp_db, tmp_path):
         """Test architecture metadata population with database error."""
@@ -78,7 +147,7 @@ class TestARMImporter:
 
         # Mock the database insert to raise an exception
         with patch.object(
-            temp_db, "insert_architecture", side_effect=Exception("DB error")
+            temp_db, "insert_architectures", side_effect=Exception("DB error")
         ):
             with patch.object(importer.logger, "error") as mock_error:
                 success = await importer.populate_architecture_metadata(tmp_path)
@@ -97,6 +166,153 @@ class TestARMImporter:
         assert "stats" in result
         assert result["stats"]["instructions_inserted"] > 0
 
+    @pytest.mark.asyncio
+    async def test_import_from_source_batch_fallback(
+        self, temp_db, sample_arm_data_dir
+    ):
+        """Test a failed batch insert is retried one instruction at a time."""
+        importer = ARMImporter(temp_db)
+        importer.batch_size = 1
+
+        with patch.object(
+            temp_db, "insert_instructions", side_effect=Exception("batch error")
+        ):
+            result = await importer.import_from_source(
+                sample_arm_data_dir, skip_metadata=True
+            )
+
+        assert result["success"]
+        assert result["stats"]["instructions_inserted"] > 0
+        assert result["stats"]["errors"] == 0
+        assert temp_db.list_instructions("aarch64")
+
+    @pytest.mark.asyncio
+    async def test_import_from_source_full_batches(self, temp_db, sample_arm_data_dir):
+        """Test batches written in the background are all counted and stored."""
+        importer = ARMImporter(temp_db)
+        importer.batch_size = 1
+
+        result = await importer.import_from_source(
+            sample_arm_data_dir, skip_metadata=True
+        )
+
+        assert result["success"]
+        assert result["stats"]["errors"] == 0
+        stored = temp_db.list_instructions("aarch64")
+        assert result["stats"]["instructions_inserted"] == len(stored) > 0
+
+    @pytest.mark.asyncio
+    async def test_import_from_source_progress_logging(
+        self, temp_db, sample_arm_data_dir
+    ):
+        """Test progress is logged every progress_interval instructions."""
+        importer = ARMImporter(temp_db)
+        importer.progress_interval = 1
+
+        with (
+            patch.object(importer.logger, "isEnabledFor", return_value=True),
+            patch.object(importer.logger, "info") as mock_info,
+        ):
+            result = await importer.import_from_source(
+                sample_arm_data_dir, skip_metadata=True
+            )
+
+        processed = result["stats"]["instructions_processed"]
+        assert processed > 0
+        progress_calls = [
+            c for c in mock_info.call_args_list if c.args[0].startswith("Processed")
+        ]
+        assert len(progress_calls) == processed
+
+    @pytest.mark.asyncio
+    async def test_import_from_source_progress_stats(
+        self, temp_db, sample_arm_data_dir
+    ):
+        """Test the processed count is published to stats during the import."""
+        importer = ARMImporter(temp_db)
+        importer.progress_interval = 1
+        seen = []
+
+        def record_progress(message, *args):
+            if message.startswith("Processed"):
+                seen.append(importer.stats["instructions_processed"])
+
+        with (
+            patch.object(importer.logger, "isEnabledFor", return_value=True),
+            patch.object(importer.logger, "info", side_effect=record_progress),
+        ):
+            result = await importer.import_from_source(
+                sample_arm_data_dir, skip_metadata=True
+            )
+
+        processed = result["stats"]["instructions_processed"]
+        assert seen == list(range(1, processed + 1))
+
+    @pytest.mark.asyncio
+    async def test_import_from_source_progress_counts_invalid(
+        self, temp_db, sample_arm_data_dir
+    ):
+        """Test instructions failing validation still reach the progress check."""
+        importer = ARMImporter(temp_db)
+        importer.progress_interval = 1
+
+        with (
+            patch.object(importer, "_validate_instruction", return_value=False),
+            patch.object(importer.logger, "isEnabledFor", return_value=True),
+            patch.object(importer.logger, "info") as mock_info,
+        ):
+            result = await importer.import_from_source(
+                sample_arm_data_dir, skip_metadata=True
+            )
+
+        processed = result["stats"]["instructions_processed"]
+        assert processed == result["stats"]["errors"] > 0
+        progress_calls = [
+            c for c in mock_info.call_args_list if c.args[0].startswith("Processed")
+        ]
+        assert len(progress_calls) == processed
+
+    @pytest.mark.asyncio
+    async def test_import_from_source_flushes_on_parse_failure(
+        self, temp_db, sample_arm_data_dir
+    ):
+        """Test instructions parsed before a source failure are still stored."""
+        importer = ARMImporter(temp_db)
+        parse_sources = importer.parse_sources
+
+        async def failing_parse_sources(source_dir):
+            async for instruction in parse_sources(source_dir):
+                yield instruction
+            raise RuntimeError("source error")
+
+        with patch.object(importer, "parse_sources", failing_parse_sources):
+            result = await importer.import_from_source(
+                sample_arm_data_dir, skip_metadata=True
+            )
+
+        assert not result["success"]
+        assert result["stats"]["instructions_processed"] > 0
+        assert result["stats"]["instructions_inserted"] > 0
+        assert temp_db.list_instructions("aarch64")
+
+    @pytest.mark.asyncio
+    async def test_import_from_source_not_implemented_error_fails(
+        self, temp_db, sample_arm_data_dir
+    ):
+        """Test NotImplementedError from an implemented importer is a failure."""
+        importer = ARMImporter(temp_db)
+
+        with patch.object(
+            importer, "get_source_version", side_effect=NotImplementedError("nope")
+        ):
+            result = await importer.import_from_source(
+                sample_arm_data_dir, skip_metadata=True
+            )
+
+        assert not result["success"]
+        assert "skipped" not in result
+        assert result["error"] == "nope"
+
     @pytest.mark.asyncio
     async def test_import_from_source_skip_metadata(self, temp_db, sample_arm_data_dir):
         """Test import process skipping metadata."""
@@ -111,3 +327,17 @@ class TestARMImporter:
         assert not hasattr(result, "metadata_imported") or not result.get(
             "metadata_imported", False
         )
+
+
+class TestISAImporterRegistry:
+    """Test cases for ISAImporterRegistry."""
+
+    def test_register_without_instantiating(self, temp_db):
+        """Test importers are registered by class attribute, not by instance."""
+        registry = ISAImporterRegistry()
+
+        with patch.object(ARMImporter, "__init__", side_effect=AssertionError):
+            registry.register(ARMImporter)
+
+        assert registry.list_supported_isas() == ["aarch64"]
+        assert isinstance(registry.get_importer("aarch64", temp_db), ARMImporter)
@@ -1,6 +1,13 @@
 """Unit tests for ARM instruction parser."""
 
+import json
+from collections.abc import Mapping
+from unittest.mock import patch
+
+import pytest
+
 from src.isa_mcp_server.importers.arm_instruction_parser import ARMInstructionParser
+from src.isa_mcp_server.isa_database import OperandRecord
 
 
 class TestARMInstructionParser:
@@ -11,7 +18,7 @@ class TestARMInstructionParser:
         parser = ARMInstructionParser()
         assert hasattr(parser, "instruction_cache")
         assert hasattr(parser, "feature_mapping")
-        assert isinstance(parser.feature_mapping, dict)
+        assert isinstance(parser.feature_mapping, Mapping)
         assert "FEAT_FP" in parser.feature_mapping
 
     def test_build_feature_mapping(self):
@@ -23,6 +30,10 @@ class TestARMInstructionParser:
         assert mapping["FEAT_ASIMD"] == "NEON"
         assert mapping["FEAT_AES"] == "AES"
         assert mapping["FEAT_SVE"] == "SVE"
+        # Built once and shared read-only by every parser
+        assert ARMInstructionParser().feature_mapping is mapping
+        with pytest.raises(TypeError):
+            mapping["FEAT_NEW"] = "NEW"
 
     def test_parse_instructions_file_missing(self, tmp_path):
         """Test parsing non-existent file."""
@@ -49,6 +60,93 @@ class TestARMInstructionParser:
         assert instruction.isa_set == "A64"
         assert "Add immediate" in instruction.description
 
+    def test_parse_instructions_file_nested_sets(self, tmp_path):
+        """Test streaming instructions nested inside instruction sets."""
+        instructions_file = tmp_path / "Instructions.json"
+        instructions_file.write_text(
+            json.dumps(
+                {
+                    "instructions": [
+                        {
+                            "_type": "Instruction.InstructionSet",
+                            "children": [
+                                {
+                                    "_type": "Instruction.Instruction",
+                                    "name": "SUB_immediate",
+                                    "title": "Subtract immediate",
+                                },
+                                {
+                                    "_type": "Instruction.Instruction",
+                                    "name": "MUL_register",
+                                    "title": "Multiply",
+                                },
+                            ],
+                        }
+                    ],
+                    "_meta": {"version": {"architecture": "v9Ap6-A"}},
+                }
+            )
+        )
+        parser = ARMInstructionParser()
+
+        instructions = list(parser.parse_instructions_file(instructions_file))
+
+        assert [i.mnemonic for i in instructions] == ["SUB", "MUL"]
+
+    def test_parse_instructions_file_streaming_matches_whole_file(
+        self, sample_arm_data_dir
+    ):
+        """Test streamed and whole-file decoding yield the same records."""
+        instructions_file = sample_arm_data_dir / "Instructions.json"
+        parser = ARMInstructionParser()
+
+        whole = list(parser.parse_instructions_file(instructions_file))
+        with patch(
+            "src.isa_mcp_server.importers.arm_instruction_parser._ORJSON_MAX_BYTES", -1
+        ):
+            streamed = list(parser.parse_instructions_file(instructions_file))
+
+        assert whole
+        assert streamed == whole
+
+    def test_parse_instructions_file_counts_errors(self, sample_arm_data_dir):
+        """Test entries that fail to parse are counted instead of raised."""
+        parser = ARMInstructionParser()
+
+        with patch.object(
+            parser, "_parse_instruction", side_effect=ValueError("bad entry")
+        ):
+            records = list(
+                parser.parse_instructions_file(
+                    sample_arm_data_dir / "Instructions.json"
+                )
+            )
+
+        assert records == []
+        assert parser.parse_errors == 1
+
+    def test_process_instruction_hierarchy_deep_nesting(self):
+        """Test hierarchies deeper than the recursion limit are walked in order."""
+        parser = ARMInstructionParser()
+        leaf = {
+            "_type": "Instruction.Instruction",
+            "name": "NOP_hint",
+            "title": "No operation",
+        }
+        root = leaf
+        for _ in range(2000):
+            root = {
+                "_type": "Instruction.InstructionGroup",
+                "children": [root, {"_type": "Instruction.Encodeset"}],
+            }
+        root["children"].append(
+            {"_type": "Instruction.Instruction", "name": "YIELD_hint", "title": "Yield"}
+        )
+
+        records = list(parser._process_instruction_hierarchy(root))
+
+        assert [r.mnemonic for r in records] == ["NOP", "YIELD"]
+
     def test_extract_mnemonic_from_name(self):
         """Test mnemonic extraction from instruction name."""
         parser = ARMInstructionParser()
@@ -79,6 +177,26 @@ class TestARMInstructionParser:
         instruction_data = {}
         mnemonic = parser._extract_mnemonic("ADD_immediate_123", instruction_data)
         assert mnemonic == "ADDIMMEDIATE"
+        assert parser._extract_mnemonic("nop", instruction_data) == "NOP"
+        assert parser._extract_mnemonic("LD1-B.x_A1", instruction_data) == "LD1BX"
+        assert parser._extract_mnemonic("MOVé_A1", instruction_data) == "MOV"
+        assert parser._extract_mnemonic("", instruction_data) is None
+
+    def test_extract_mnemonic_malformed_assembly(self):
+        """Test malformed assembly data falls back to the instruction name."""
+        parser = ARMInstructionParser()
+
+        for assembly in [
+            "MOV",
+            [],
+            {"symbols": []},
+            {"_type": "Instruction.Assembly", "symbols": []},
+            {"_type": "Instruction.Assembly", "symbols": {}},
+            {"_type": "Instruction.Assembly", "symbols": ["MOV"]},
+            {"_type": "Instruction.Assembly", "symbols": [{"value": "MOV"}]},
+        ]:
+            mnemonic = parser._extract_mnemonic("SUB_imm", {"assembly": assembly})
+            assert mnemonic == "SUB"
 
     def test_extract_description(self):
         """Test description extraction."""
@@ -99,6 +217,11 @@ class TestARMInstructionParser:
         description = parser._extract_description(instruction_data)
         assert description == "ARM AArch64 instruction"
 
+        # Non-mapping descriptions and non-string text also fall back
+        for description_obj in ["Add operation", None, {"after": ["text"]}]:
+            description = parser._extract_description({"description": description_obj})
+            assert description == "ARM AArch64 instruction"
+
     def test_generate_syntax_no_operands(self):
         """Test syntax generation without operands."""
         parser = ARMInstructionParser()
@@ -106,6 +229,22 @@ class TestARMInstructionParser:
         syntax = parser._generate_syntax("NOP", [])
         assert syntax == "NOP"
 
+    def test_generate_syntax_operand_tokens(self):
+        """Test operand types map to syntax placeholders."""
+        parser = ARMInstructionParser()
+        operands = [
+            OperandRecord(name=name, type=op_type, access="r")
+            for name, op_type in [
+                ("Xd", "register"),
+                ("addr", "memory"),
+                ("imm", "immediate"),
+                ("label", "label"),
+            ]
+        ]
+
+        syntax = parser._generate_syntax("LDR", operands)
+        assert syntax == "LDR reg, mem, imm, label"
+
     def test_generate_basic_syntax(self):
         """Test basic syntax generation."""
         parser = ARMInstructionParser()
@@ -26,6 +26,12 @@ class TestARMMetadataParser:
         version = parser.get_version_info()
         assert version is None
 
+    def test_get_version_info_without_meta(self, tmp_path):
+        """Test version info when the file has no _meta block."""
+        (tmp_path / "Instructions.json").write_text('{"instructions": []}')
+        parser = ARMMetadataParser(tmp_path)
+        assert parser.get_version_info() is None
+
     def test_parse_architectures(self, sample_arm_data_dir):
         """Test architecture parsing."""
         parser = ARMMetadataParser(sample_arm_data_dir)
@@ -106,3 +112,32 @@ class TestARMMetadataParser:
         features = parser.get_cpu_features()
 
         assert features == {"aarch64": ["BASE"]}
+
+    def test_parse_registers_returns_independent_copies(self, sample_arm_data_dir):
+        """Test mutating returned registers does not affect later calls."""
+        parser = ARMMetadataParser(sample_arm_data_dir)
+        first = parser.parse_registers()
+        first[0].architecture_id = 99
+
+        second = parser.parse_registers()
+        assert second[0].architecture_id != 99
+        assert len(first) == len(second)
+
+    def test_parse_registers_with_architecture_id(self, sample_arm_data_dir):
+        """Test registers and addressing modes are tagged with the given ID."""
+        parser = ARMMetadataParser(sample_arm_data_dir)
+
+        registers = parser.parse_registers(architecture_id=7)
+        modes = parser.parse_addressing_modes(architecture_id=7)
+
+        assert all(reg.architecture_id == 7 for reg in registers)
+        assert all(mode.architecture_id == 7 for mode in modes)
+
+    def test_get_cpu_features_reads_file_once(self, sample_arm_data_dir):
+        """Test Features.json is decoded once per parser instance."""
+        parser = ARMMetadataParser(sample_arm_data_dir)
+        first = parser.get_cpu_features()
+
+        (sample_arm_data_dir / "Features.json").unlink()
+
+        assert parser.get_cpu_features() == first
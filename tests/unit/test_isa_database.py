@@ -0,0 +1,343 @@
+"""Unit tests for ISADatabase."""
+
+import json
+import sqlite3
+from dataclasses import asdict
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.isa_mcp_server import isa_database
+from src.isa_mcp_server.isa_database import (
+    AddressingModeRecord,
+    ArchitectureRecord,
+    EncodingRecord,
+    InstructionRecord,
+    ISADatabase,
+    OperandRecord,
+    RegisterRecord,
+)
+
+
+class TestInstructionRecords:
+    """Test cases for instruction record dataclasses."""
+
+    def test_records_use_slots(self):
+        """Test record dataclasses carry no per-instance __dict__."""
+        records = [
+            InstructionRecord(isa="x86_64", mnemonic="ADD"),
+            OperandRecord(name="REG0", type="register", access="rw"),
+            EncodingRecord(pattern="0x01 MOD[mm] REG[rrr] RM[nnn]"),
+            ArchitectureRecord(isa_name="x86_64", word_size=64, endianness="little"),
+            RegisterRecord(
+                architecture_id=1,
+                register_name="RAX",
+                register_class="gpr",
+                width_bits=64,
+            ),
+            AddressingModeRecord(architecture_id=1, mode_name="immediate"),
+        ]
+
+        for record in records:
+            assert not hasattr(record, "__dict__")
+
+
+class TestISADatabaseBulkInserts:
+    """Test cases for bulk inserts."""
+
+    def test_insert_registers_bulk(self, temp_db):
+        """Test inserting many registers through the metadata insert."""
+        arch_id = temp_db.insert_architecture(
+            ArchitectureRecord(isa_name="x86_64", word_size=64, endianness="little")
+        )
+        registers = [
+            RegisterRecord(
+                architecture_id=arch_id,
+                register_name=name,
+                register_class="gpr",
+                width_bits=64,
+                encoding_id=i,
+            )
+            for i, name in enumerate(["RAX", "RBX", "RCX"])
+        ]
+
+        temp_db.insert_architecture_metadata(registers, [])
+
+        stored = temp_db.get_architecture_registers("x86_64")
+        assert [r.register_name for r in stored] == ["RAX", "RBX", "RCX"]
+        assert all(r.architecture_id == arch_id for r in stored)
+
+    def test_insert_architecture_metadata_empty(self, temp_db):
+        """Test metadata insert with no registers or addressing modes."""
+        temp_db.insert_architecture(
+            ArchitectureRecord(isa_name="x86_64", word_size=64, endianness="little")
+        )
+
+        temp_db.insert_architecture_metadata([], [])
+
+        assert temp_db.get_architecture_registers("x86_64") == []
+        assert temp_db.get_architecture_addressing_modes("x86_64") == []
+
+    def test_insert_addressing_modes_bulk(self, temp_db):
+        """Test inserting many addressing modes through the metadata insert."""
+        arch_id = temp_db.insert_architecture(
+            ArchitectureRecord(isa_name="aarch64", word_size=64, endianness="little")
+        )
+        modes = [
+            AddressingModeRecord(
+                architecture_id=arch_id,
+                mode_name="immediate",
+                description="Immediate addressing",
+                example_syntax="MOV X0, #42",
+            ),
+            AddressingModeRecord(
+                architecture_id=arch_id,
+                mode_name="base_register",
+                description="Base register addressing",
+                example_syntax="LDR X0, [X1]",
+            ),
+        ]
+
+        temp_db.insert_architecture_metadata([], modes)
+
+        stored = temp_db.get_architecture_addressing_modes("aarch64")
+        assert [m.mode_name for m in stored] == ["base_register", "immediate"]
+
+    def test_insert_instructions(self, temp_db):
+        """Test inserting many instructions in one transaction."""
+        instructions = [
+            InstructionRecord(
+                isa="x86_64",
+                mnemonic=mnemonic,
+                category="BINARY",
+                extension="BASE",
+                description=f"{mnemonic} instruction",
+            )
+            for mnemonic in ["ADD", "SUB", "MUL"]
+        ]
+
+        inserted = temp_db.insert_instructions(instructions)
+
+        assert inserted == 3
+        stored = temp_db.get_instruction("x86_64", "SUB")
+        assert stored is not None
+        assert stored.description == "SUB instruction"
+
+    def test_instruction_json_columns(self, temp_db):
+        """Test operand, encoding and list columns serialize as before."""
+        instruction = InstructionRecord(
+            isa="x86_64",
+            mnemonic="ADD",
+            category="BINARY",
+            extension="BASE",
+            operands=[OperandRecord(name="REG0", type="register", access="rw")],
+            encoding=EncodingRecord(pattern="0x01", opcode="0x01", modrm=True),
+            flags_affected=["CF", "ZF"],
+            cpuid_features=[],
+            attributes=None,
+        )
+
+        params = temp_db._instruction_params(instruction)
+
+        assert json.loads(params[8]) == [asdict(instruction.operands[0])]
+        assert json.loads(params[9]) == asdict(instruction.encoding)
+        assert json.loads(params[10]) == ["CF", "ZF"]
+        assert params[11:13] == ("[]", "[]")
+        assert all(isinstance(p, str) for p in params[8:13])
+
+    def test_instruction_json_columns_without_orjson(self, temp_db):
+        """Test JSON columns decode the same with the stdlib fallback."""
+        instruction = InstructionRecord(
+            isa="x86_64",
+            mnemonic="ADD",
+            category="BINARY",
+            extension="BASE",
+            operands=[OperandRecord(name="REG0", type="register", access="rw")],
+            encoding=EncodingRecord(pattern="0x01", opcode="0x01"),
+            flags_affected=["CF"],
+        )
+
+        with patch.object(isa_database, "orjson", None):
+            fallback = temp_db._instruction_params(instruction)
+        params = temp_db._instruction_params(instruction)
+
+        for column in range(8, 13):
+            assert json.loads(fallback[column]) == json.loads(params[column])
+
+    def test_insert_instructions_empty(self, temp_db):
+        """Test bulk insert with no instructions."""
+        assert temp_db.insert_instructions([]) == 0
+
+
+class TestISADatabaseConnectionSettings:
+    """Test cases for connection PRAGMA configuration."""
+
+    def test_default_mode_pragmas(self, temp_db):
+        """Test WAL journaling and NORMAL sync in default mode."""
+        with temp_db.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            # synchronous: 0=OFF, 1=NORMAL, 2=FULL
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            # temp_store: 2=MEMORY
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+
+    def test_wal_skipped_for_read_only_directory(self, tmp_path):
+        """Test initialization keeps the default journal without write access."""
+        db = ISADatabase(str(tmp_path / "readonly.db"))
+
+        with patch.object(isa_database.os, "access", return_value=False):
+            db.initialize_database()
+
+        with db.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+    def test_wal_failure_ignored(self, tmp_path):
+        """Test a database that cannot switch to WAL still initializes."""
+        db = ISADatabase(str(tmp_path / "readonly.db"))
+        conn = MagicMock()
+        conn.execute.side_effect = sqlite3.OperationalError(
+            "attempt to write a readonly database"
+        )
+
+        db._enable_wal(conn)
+
+        conn.execute.assert_called_once_with("PRAGMA journal_mode=WAL")
+
+    def test_bulk_mode_pragmas(self, tmp_path):
+        """Test bulk mode disables sync and keeps the journal in memory."""
+        db = ISADatabase(str(tmp_path / "bulk.db"), bulk_mode=True)
+        db.initialize_database()
+
+        with db.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+
+
+class TestISADatabaseArchitectureMetadata:
+    """Test cases for combined architecture metadata inserts."""
+
+    def test_insert_architecture_metadata(self, temp_db):
+        """Test registers and addressing modes are stored together."""
+        arch_id = temp_db.insert_architecture(
+            ArchitectureRecord(isa_name="x86_32", word_size=32, endianness="little")
+        )
+
+        temp_db.insert_architecture_metadata(
+            [
+                RegisterRecord(
+                    architecture_id=arch_id,
+                    register_name="EAX",
+                    register_class="gpr",
+                    width_bits=32,
+                )
+            ],
+            [
+                AddressingModeRecord(
+                    architecture_id=arch_id,
+                    mode_name="immediate",
+                    description="Immediate addressing",
+                    example_syntax="MOV EAX, 42",
+                )
+            ],
+        )
+
+        registers = temp_db.get_architecture_registers("x86_32")
+        modes = temp_db.get_architecture_addressing_modes("x86_32")
+        assert [r.register_name for r in registers] == ["EAX"]
+        assert [m.mode_name for m in modes] == ["immediate"]
+
+    def test_metadata_indexes_recreated(self, temp_db):
+        """Test metadata indexes are rebuilt after a bulk metadata load."""
+
+        def index_names():
+            with temp_db.get_connection() as conn:
+                rows = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' "
+                    "AND tbl_name IN "
+                    "('architecture_registers', 'architecture_addressing_modes')"
+                ).fetchall()
+            return {row[0] for row in rows}
+
+        expected = {
+            "idx_registers_architecture_id",
+            "idx_addressing_modes_architecture_id",
+            "idx_registers_parent_id",
+            "idx_registers_purpose",
+        }
+        assert index_names() == expected
+
+        arch_id = temp_db.insert_architecture(
+            ArchitectureRecord(isa_name="x86_64", word_size=64, endianness="little")
+        )
+        temp_db.insert_architecture_metadata(
+            [
+                RegisterRecord(
+                    architecture_id=arch_id,
+                    register_name="RAX",
+                    register_class="gpr",
+                    width_bits=64,
+                )
+            ],
+            [],
+        )
+        assert index_names() == expected
+
+        temp_db.insert_architecture_metadata([], [])
+        assert index_names() == expected
+
+    def test_metadata_indexes_survive_failed_insert(self, temp_db):
+        """Test a failed metadata insert leaves the indexes and rows intact."""
+        arch_id = temp_db.insert_architecture(
+            ArchitectureRecord(isa_name="x86_64", word_size=64, endianness="little")
+        )
+
+        def index_names():
+            with temp_db.get_connection() as conn:
+                rows = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' "
+                    "AND name LIKE 'idx_%'"
+                ).fetchall()
+            return {row[0] for row in rows}
+
+        expected = index_names()
+        registers = [
+            RegisterRecord(
+                architecture_id=arch_id,
+                register_name=name,
+                register_class="gpr",
+                width_bits=64,
+            )
+            for name in ["RAX", None]
+        ]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            temp_db.insert_architecture_metadata(registers, [])
+
+        assert index_names() == expected
+        assert temp_db.get_architecture_registers("x86_64") == []
+
+
+class TestISADatabaseArchitectures:
+    """Test cases for batched architecture inserts."""
+
+    def test_insert_architectures(self, temp_db):
+        """Test all architectures are inserted and their IDs returned by name."""
+        arch_ids = temp_db.insert_architectures(
+            [
+                ArchitectureRecord(
+                    isa_name="x86_32", word_size=32, endianness="little"
+                ),
+                ArchitectureRecord(
+                    isa_name="x86_64", word_size=64, endianness="little"
+                ),
+            ]
+        )
+
+        assert set(arch_ids) == {"x86_32", "x86_64"}
+        for isa_name, arch_id in arch_ids.items():
+            assert temp_db.get_architecture(isa_name).id == arch_id
+
+    def test_insert_architectures_empty(self, temp_db):
+        """Test batched insert with no architectures."""
+        assert temp_db.insert_architectures([]) == {}
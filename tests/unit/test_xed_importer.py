@@ -0,0 +1,420 @@
+"""Unit tests for XEDImporter."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.isa_mcp_server.importers import xed_importer
+from src.isa_mcp_server.importers.xed_importer import XEDImporter
+from src.isa_mcp_server.importers.xed_parser import XEDInstruction
+
+
+class TestXEDImporterSources:
+    """Test cases for locating XED source files."""
+
+    def test_list_extension_files(self, temp_db, tmp_path):
+        """Test only .xed.txt files are listed and missing directories are empty."""
+        importer = XEDImporter(temp_db)
+        (tmp_path / "avx.xed.txt").write_text("", encoding="utf-8")
+        (tmp_path / "avx-isa.txt").write_text("", encoding="utf-8")
+        (tmp_path / "nested.xed.txt").mkdir()
+
+        assert importer._list_extension_files(tmp_path) == [tmp_path / "avx.xed.txt"]
+        assert importer._list_extension_files(tmp_path / "missing") == []
+        assert importer._list_extension_files(tmp_path / "avx.xed.txt") == []
+
+    @pytest.mark.asyncio
+    async def test_parse_source_batches(self, temp_db, sample_xed_data_dir):
+        """Test each parsed chunk is handed over as one list."""
+        importer = XEDImporter(temp_db)
+
+        batches = [b async for b in importer.parse_source_batches(sample_xed_data_dir)]
+        instructions = [i async for i in importer.parse_sources(sample_xed_data_dir)]
+
+        assert len(batches) == 1
+        assert [(i.isa, i.mnemonic) for i in batches[0]] == [
+            (i.isa, i.mnemonic) for i in instructions
+        ]
+        assert {i.isa for i in instructions} == {"x86_32", "x86_64"}
+
+    @pytest.mark.asyncio
+    async def test_parse_cache(self, temp_db, sample_xed_data_dir, tmp_path):
+        """Test parsed records are reused until a source file changes."""
+        cache_dir = tmp_path / "cache"
+        importer = XEDImporter(temp_db, parse_cache_dir=cache_dir)
+        parsed = [i async for i in importer.parse_sources(sample_xed_data_dir)]
+        assert len(list(cache_dir.glob("xed-*.pkl"))) == 1
+
+        cached_importer = XEDImporter(temp_db, parse_cache_dir=cache_dir)
+        with patch.object(
+            cached_importer, "_process_file", side_effect=AssertionError("parsed")
+        ):
+            cached = [
+                i async for i in cached_importer.parse_sources(sample_xed_data_dir)
+            ]
+        assert cached == parsed
+
+        isa_file = sample_xed_data_dir / "datafiles" / "xed-isa.txt"
+        isa_file.write_text(isa_file.read_text() + "\n", encoding="utf-8")
+        reparsed = [i async for i in importer.parse_sources(sample_xed_data_dir)]
+        assert reparsed == parsed
+        assert len(list(cache_dir.glob("xed-*.pkl"))) == 2
+
+    @pytest.mark.asyncio
+    async def test_parse_cache_skipped_on_errors(
+        self, temp_db, sample_xed_data_dir, tmp_path
+    ):
+        """Test a parse that failed part way is not written to the cache."""
+        importer = XEDImporter(temp_db, parse_cache_dir=tmp_path)
+        parse_file = importer.parser.parse_file
+
+        def failing_parse_file(file_path):
+            if file_path.name == "xed-isa.txt":
+                raise OSError("unreadable")
+            return parse_file(file_path)
+
+        with patch.object(importer.parser, "parse_file", failing_parse_file):
+            [i async for i in importer.parse_sources(sample_xed_data_dir)]
+
+        assert importer.stats["errors"] == 1
+        assert list(tmp_path.glob("xed-*.pkl")) == []
+
+    def test_parse_cache_format_in_key(self, temp_db, sample_xed_data_dir, tmp_path):
+        """Test bumping the cache format selects a different cache file."""
+        importer = XEDImporter(temp_db, parse_cache_dir=tmp_path)
+        source_files = [sample_xed_data_dir / "datafiles" / "xed-isa.txt"]
+
+        cache_file = importer._parse_cache_file(sample_xed_data_dir, source_files)
+        with patch.object(
+            xed_importer, "_PARSE_CACHE_FORMAT", xed_importer._PARSE_CACHE_FORMAT + 1
+        ):
+            bumped = importer._parse_cache_file(sample_xed_data_dir, source_files)
+
+        assert bumped != cache_file
+
+    @pytest.mark.asyncio
+    async def test_parse_cache_unreadable(self, temp_db, sample_xed_data_dir, tmp_path):
+        """Test a corrupt cache file is ignored and the sources are parsed."""
+        importer = XEDImporter(temp_db, parse_cache_dir=tmp_path)
+        parsed = [i async for i in importer.parse_sources(sample_xed_data_dir)]
+        (cache_file,) = tmp_path.glob("xed-*.pkl")
+        cache_file.write_bytes(b"not a pickle")
+
+        with patch.object(importer.logger, "warning") as mock_warning:
+            reparsed = [i async for i in importer.parse_sources(sample_xed_data_dir)]
+
+        assert reparsed == parsed
+        mock_warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_parse_workers(self, temp_db, sample_xed_data_dir):
+        """Test files parsed in worker processes match an in-process parse."""
+        ext_dir = sample_xed_data_dir / "datafiles" / "cet"
+        ext_dir.mkdir()
+        (ext_dir / "cet-isa.xed.txt").write_text(
+            "{\nICLASS : ENDBR64\nCATEGORY : CET\nEXTENSION : CET\n"
+            "ISA_SET : CET\nPATTERN : 0xF3 0x0F 0x1E mode64\n}\n"
+            "{\nICLASS : BROKEN\nCPL : x\n}\n",
+            encoding="utf-8",
+        )
+        importer = XEDImporter(temp_db)
+        expected = [i async for i in importer.parse_sources(sample_xed_data_dir)]
+
+        parallel = XEDImporter(temp_db, parse_workers=2)
+        with patch.object(parallel, "_process_file", side_effect=AssertionError):
+            records = [i async for i in parallel.parse_sources(sample_xed_data_dir)]
+
+        assert records == expected
+        assert [r.mnemonic for r in records] == ["MOV", "MOV", "ENDBR64"]
+        assert parallel.stats["errors"] == importer.stats["errors"] == 1
+
+
+class TestXEDImporterEncoding:
+    """Test cases for XED pattern encoding parsing."""
+
+    def test_parse_encoding(self, temp_db):
+        """Test opcode bytes and structural flags are extracted."""
+        importer = XEDImporter(temp_db)
+
+        encoding = importer._parse_encoding(
+            "0x0F 0xB6 MOD[mm] MOD!=3 REG[rrr] RM[nnn] MODRM() SIB() DISP(32)"
+        )
+
+        assert encoding.opcode == "0x0F 0xB6"
+        assert encoding.modrm
+        assert encoding.sib
+        assert encoding.displacement == "yes"
+        assert encoding.immediate is None
+
+    def test_parse_encoding_immediates(self, temp_db):
+        """Test every immediate token is recognized."""
+        importer = XEDImporter(temp_db)
+
+        for token in [
+            "UIMM8()",
+            "SIMM8()",
+            "UIMM16()",
+            "SIMM16()",
+            "UIMM32()",
+            "SIMM32()",
+            "SIMMz()",
+        ]:
+            encoding = importer._parse_encoding(f"0xB8 {token}")
+            assert encoding.immediate == "yes", token
+
+        assert importer._parse_encoding("0xB8 UIMMz()").immediate is None
+        assert importer._parse_encoding("0xB8 UIMM8").immediate is None
+
+    def test_parse_encoding_without_opcode_or_tokens(self, temp_db):
+        """Test patterns with no opcode bytes or call tokens take the fast path."""
+        importer = XEDImporter(temp_db)
+
+        encoding = importer._parse_encoding("VV1 MOD[0b11] MOD=3 REG[rrr] RM[nnn]")
+
+        assert encoding.pattern == "VV1 MOD[0b11] MOD=3 REG[rrr] RM[nnn]"
+        assert encoding.opcode is None
+        assert encoding.modrm
+        assert not encoding.sib
+        assert encoding.displacement is None and encoding.immediate is None
+        assert not importer._parse_encoding("VV1 VL=1").modrm
+
+    def test_parse_encoding_empty(self, temp_db):
+        """Test an empty pattern has no encoding."""
+        importer = XEDImporter(temp_db)
+
+        assert importer._parse_encoding("") is None
+
+
+class TestXEDImporterOperands:
+    """Test cases for XED operand parsing."""
+
+    def test_normalize_operand_type(self, temp_db):
+        """Test known types are mapped and others lowercased."""
+        importer = XEDImporter(temp_db)
+
+        assert importer._normalize_operand_type("GPR64_B()") == "register"
+        assert importer._normalize_operand_type("mem128") == "memory"
+        assert importer._normalize_operand_type("SIMMz") == "immediate"
+        assert importer._normalize_operand_type("GPRv()") == "gprv"
+        assert importer._normalize_operand_type("") == "unknown"
+
+    def test_parse_operands(self, temp_db):
+        """Test NAME=TYPE:ACCESS and NAME:ACCESS:TYPE forms are both parsed."""
+        importer = XEDImporter(temp_db)
+
+        operands = importer._parse_operands(
+            "REG0=GPR8_B():w MEM0:r:mem128 IMM0:r BASE0=ArSP():rw:SUPP SKIP A:b=c"
+        )
+
+        assert [(o.name, o.type, o.access, o.size) for o in operands] == [
+            ("REG0", "register", "w", None),
+            ("MEM0", "memory", "r", None),
+            ("IMM0", "unknown", "r", None),
+            ("BASE0", "arsp", "rw", "SUPP"),
+        ]
+        assert importer._parse_operands("") == []
+
+    def test_generate_syntax(self, temp_db):
+        """Test only explicit operands appear, as syntax tokens."""
+        importer = XEDImporter(temp_db)
+        operands = importer._parse_operands("REG0=GPR8_B():w MEM0:r:mem128 IMM0:r:z")
+        operands[2].visibility = "SUPPRESSED"
+        entry = XEDInstruction("MOV")
+
+        assert importer._generate_syntax(entry, operands) == "MOV reg, mem"
+        assert importer._generate_syntax(entry, operands[2:]) == "MOV"
+        assert importer._generate_syntax(entry, []) == "MOV"
+
+
+class TestXEDImporterFlags:
+    """Test cases for XED flags parsing."""
+
+    def test_parse_flags(self, temp_db):
+        """Test written flags are mapped once each, in order."""
+        importer = XEDImporter(temp_db)
+
+        flags = importer._parse_flags(
+            "MUST [ fc0-mod of-w fc3-u cf-set sf-clr fc3-mod zf-mod ]"
+        )
+
+        assert flags == ["CF", "OF", "SF", "ZF"]
+        assert importer._parse_flags("MAY [ xx1-mod ]") == ["XX1"]
+        assert importer._parse_flags("") == []
+
+
+class TestXEDImporterVariant:
+    """Test cases for XED variant naming."""
+
+    def test_variant_from_operands_is_stable(self, temp_db):
+        """Test operand-derived variants are fixed digests, not hash() values."""
+        importer = XEDImporter(temp_db)
+        entry = XEDInstruction(iclass="ADD", operands="REG0=GPRv():rw REG1=GPRv():r")
+
+        assert importer._determine_variant(entry) == "var_da882d1a"
+        assert importer._determine_variant(
+            XEDInstruction(iclass="ADD", operands="REG0=GPRv():rw IMM0:r:z")
+        ) != importer._determine_variant(entry)
+
+    def test_variant_prefers_uname_and_iform(self, temp_db):
+        """Test UNAME and IFORM take precedence over the operand digest."""
+        importer = XEDImporter(temp_db)
+
+        assert (
+            importer._determine_variant(
+                XEDInstruction(
+                    iclass="ADD", uname="ADD_U", iform="ADD_GPRv", operands="x"
+                )
+            )
+            == "ADD_U"
+        )
+        assert (
+            importer._determine_variant(
+                XEDInstruction(iclass="ADD", iform="ADD_GPRv", operands="x")
+            )
+            == "ADD_GPRv"
+        )
+        assert importer._determine_variant(XEDInstruction(iclass="NOP")) is None
+
+
+class TestXEDImporterCpuidFeatures:
+    """Test cases for ISA_SET to CPUID feature mapping."""
+
+    def test_get_cpuid_features(self, temp_db):
+        """Test features are looked up per ISA_SET."""
+        importer = XEDImporter(temp_db)
+        cet = XEDInstruction(iclass="ENDBR64", isa_set="CET")
+
+        features = importer._get_cpuid_features(cet)
+        assert features == ["CET_IBT", "CET_SS"]
+        assert importer._get_cpuid_features(XEDInstruction("ADD", isa_set="I86")) == []
+        assert importer._get_cpuid_features(XEDInstruction("X", isa_set="NEW")) == []
+
+
+class TestXEDImporterTargetArchitectures:
+    """Test cases for choosing x86_32/x86_64 targets."""
+
+    def test_determine_target_architectures(self, temp_db):
+        """Test pattern, attribute and iclass mode indicators."""
+        importer = XEDImporter(temp_db)
+
+        def targets(**kwargs):
+            entry = XEDInstruction(**{"iclass": "ADD", **kwargs})
+            return importer._determine_target_architectures(entry)
+
+        assert targets() == ["x86_32", "x86_64"]
+        assert targets(pattern="0x05 MODE64 SIMMz()") == ["x86_64"]
+        assert targets(pattern="mode32 0x06") == ["x86_32"]
+        assert targets(pattern="mode64 not64") == ["x86_32"]
+        assert targets(pattern="REXW_PREFIX 0x63") == ["x86_64"]
+        assert targets(extension="LONGMODE") == ["x86_64"]
+        assert targets(attributes=["longmode"]) == ["x86_64"]
+        assert targets(iclass="SYSCALL") == ["x86_64"]
+        assert targets(iclass="SYSCALL", attributes=["PROTECTED_MODE"]) == [
+            "x86_32",
+            "x86_64",
+        ]
+
+
+class TestXEDImporterConversion:
+    """Test cases for converting XED entries to instruction records."""
+
+    def test_repeated_strings_parsed_once(self, temp_db):
+        """Test operand, pattern and flags strings shared by entries parse once."""
+        importer = XEDImporter(temp_db)
+        entries = [
+            XEDInstruction(
+                iclass=iclass,
+                category="BINARY",
+                extension="BASE",
+                isa_set="I86",
+                pattern="0x01 MOD[mm] REG[rrr] RM[nnn] MODRM()",
+                operands="REG0=GPRv():rw REG1=GPRv():r",
+                flags="MUST [ of-mod sf-mod zf-mod ]",
+            )
+            for iclass in ["ADD", "ADC"]
+        ]
+
+        with (
+            patch.object(
+                importer, "_parse_operands", wraps=importer._parse_operands
+            ) as parse_operands,
+            patch.object(
+                importer, "_parse_encoding", wraps=importer._parse_encoding
+            ) as parse_encoding,
+            patch.object(
+                importer, "_parse_flags", wraps=importer._parse_flags
+            ) as parse_flags,
+            patch.object(
+                xed_importer, "_mode_markers", wraps=xed_importer._mode_markers
+            ) as mode_markers,
+        ):
+            add, adc = (importer._convert_to_instruction_record(e) for e in entries)
+
+        assert parse_operands.call_count == 1
+        assert parse_encoding.call_count == 1
+        assert parse_flags.call_count == 1
+        assert mode_markers.call_count == 1
+        assert add[0].mnemonic == "ADD" and adc[0].mnemonic == "ADC"
+        assert add[0].operands == adc[0].operands
+        assert add[0].flags_affected == ["OF", "SF", "ZF"]
+        assert add[0].cpuid_features == add[1].cpuid_features
+
+    def test_generate_description(self, temp_db):
+        """Test known categories get a description and others a generic one."""
+        importer = XEDImporter(temp_db)
+
+        assert (
+            importer._generate_description(XEDInstruction("ADD", category="BINARY"))
+            == "ADD - Binary arithmetic operation"
+        )
+        assert (
+            importer._generate_description(
+                XEDInstruction("ADD", category="BINARY", disasm="add")
+            )
+            == "add - Binary arithmetic operation"
+        )
+        assert (
+            importer._generate_description(XEDInstruction("VZEROALL", category="NEW"))
+            == "VZEROALL - NEW operation"
+        )
+
+    def test_record_fields(self, temp_db):
+        """Test every XED field lands in the matching record field."""
+        importer = XEDImporter(temp_db)
+        entry = XEDInstruction(
+            iclass="ENDBR64",
+            uname="ENDBR64_U",
+            cpl=3,
+            category="CET",
+            extension="CET",
+            isa_set="CET",
+            attributes=["NOP"],
+            pattern="0xF3 0x0F 0x1E MOD[0b11] mode64",
+            operands="",
+            disasm="endbr64",
+            flags="MUST [ zf-mod ]",
+        )
+
+        (record,) = importer._convert_to_instruction_record(entry)
+
+        assert record.id is None
+        assert (record.isa, record.mnemonic, record.variant) == (
+            "x86_64",
+            "ENDBR64",
+            "ENDBR64_U",
+        )
+        assert (record.category, record.extension, record.isa_set) == (
+            "CET",
+            "CET",
+            "CET",
+        )
+        assert record.description == "endbr64 - CET operation"
+        assert record.syntax == "endbr64"
+        assert record.operands == []
+        assert record.encoding.opcode == "0xF3 0x0F 0x1E"
+        assert record.flags_affected == ["ZF"]
+        assert record.cpuid_features == ["CET_IBT", "CET_SS"]
+        assert record.cpl == 3
+        assert record.attributes == ["NOP"]
+        assert record.added_version is None
+        assert record.deprecated is False
@@ -0,0 +1,84 @@
+"""Unit tests for XEDMetadataParser."""
+
+from src.isa_mcp_server.xed_metadata_parser import XEDMetadataParser
+
+
+class TestXEDMetadataParserRegisters:
+    """Test cases for register classification."""
+
+    def test_register_modes(self, tmp_path):
+        """Test registers are assigned to x86_32 and x86_64 by name and class."""
+        parser = XEDMetadataParser(tmp_path)
+
+        def modes(reg_name, reg_class, width):
+            return (
+                parser._is_32bit_register(reg_name, reg_class, width),
+                parser._is_64bit_register(reg_name, reg_class, width),
+            )
+
+        assert modes("RAX", "gpr", 64) == (False, True)
+        assert modes("EAX", "gpr", 32) == (True, True)
+        assert modes("R8D", "gpr", 32) == (False, True)
+        assert modes("R20D", "gpr", 32) == (False, True)
+        assert modes("SI", "gpr", 16) == (True, True)
+        assert modes("R9W", "gpr", 16) == (False, True)
+        assert modes("AH", "gpr", 8) == (True, True)
+        assert modes("SIL", "gpr", 8) == (False, True)
+        assert modes("R15B", "gpr", 8) == (False, True)
+        assert modes("EFLAGS", "flags", 32) == (True, False)
+        assert modes("RFLAGS", "flags", 64) == (False, True)
+        assert modes("XMM0", "xmm", 128) == (True, True)
+        assert modes("YMM0", "ymm", 256) == (False, True)
+        assert modes("K0", "mask", 64) == (False, False)
+
+    def test_main_registers(self, tmp_path):
+        """Test only full-width architectural registers are main registers."""
+        parser = XEDMetadataParser(tmp_path)
+
+        main = [
+            ("RAX", "gpr", 64),
+            ("R15", "gpr", 64),
+            ("EDI", "gpr", 32),
+            ("RFLAGS", "flags", 64),
+            ("FS", "sr", 16),
+            ("CR3", "cr", 64),
+            ("DR7", "dr", 64),
+            ("XMM15", "xmm", 128),
+        ]
+        not_main = [
+            ("RIP", "gpr", 64),
+            ("R16", "gpr", 64),
+            ("R8D", "gpr", 32),
+            ("AX", "gpr", 16),
+            ("FLAGS", "flags", 16),
+            ("CR8", "cr", 64),
+            ("ZMM0", "zmm", 512),
+        ]
+
+        assert all(parser._is_main_register(*reg) for reg in main)
+        assert not any(parser._is_main_register(*reg) for reg in not_main)
+
+    def test_parse_registers(self, tmp_path):
+        """Test register lines, including trailing fields, are parsed."""
+        (tmp_path / "xed-regs.txt").write_text(
+            "# name class width max-enclosing regid [h]\n"
+            "\n"
+            "RAX gpr 64 RAX 0\n"
+            "EAX gpr 32/32 RAX 0\n"
+            "AH gpr 8 RAX 4 h extra fields\n",
+            encoding="utf-8",
+        )
+        parser = XEDMetadataParser(tmp_path)
+
+        x86_32, x86_64 = parser.parse_registers(x86_32_arch_id=1, x86_64_arch_id=2)
+
+        assert [(r.register_name, r.width_bits) for r in x86_32] == [
+            ("EAX", 32),
+            ("AH", 8),
+        ]
+        assert [(r.register_name, r.encoding_id) for r in x86_64] == [
+            ("RAX", 0),
+            ("EAX", 0),
+            ("AH", 4),
+        ]
+        assert {r.architecture_id for r in x86_64} == {2}
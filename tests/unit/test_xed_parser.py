@@ -0,0 +1,106 @@
+"""Unit tests for XEDParser."""
+
+from src.isa_mcp_server.importers.xed_parser import XEDParser
+
+
+class TestXEDParser:
+    """Test cases for XEDParser."""
+
+    def test_parse_file(self, tmp_path):
+        """Test blocks are parsed from a streamed file."""
+        isa_file = tmp_path / "test.xed.txt"
+        isa_file.write_text(
+            """# Comment before the first block
+
+{
+ICLASS    : ADD
+# Comment inside a block
+CPL       : 3
+CATEGORY  : BINARY
+ATTRIBUTES: LOCKABLE  SCALABLE
+PATTERN   : 0x01 MOD[mm] REG[rrr] RM[nnn]
+OPERANDS  : REG0=GPRv():rw REG1=GPRv():r
+}
+{
+UNAME     : NO_ICLASS
+}
+stray line
+{
+ICLASS    : NOP
+""",
+            encoding="utf-8",
+        )
+
+        instructions = list(XEDParser().parse_file(isa_file))
+
+        assert [i.iclass for i in instructions] == ["ADD", "NOP"]
+        add = instructions[0]
+        assert add.cpl == 3
+        assert add.category == "BINARY"
+        assert add.attributes == ["LOCKABLE", "SCALABLE"]
+        assert add.pattern == "0x01 MOD[mm] REG[rrr] RM[nnn]"
+        assert add.operands == "REG0=GPRv():rw REG1=GPRv():r"
+
+    def test_repeated_fields_interned(self, tmp_path):
+        """Test repeated enum-like field values share one object."""
+        isa_file = tmp_path / "test.xed.txt"
+        isa_file.write_text(
+            "".join(
+                "{\nICLASS : ADD\nCATEGORY : BINARY\n"
+                "EXTENSION : BASE\nISA_SET : I86\nATTRIBUTES : SCALABLE\n}\n"
+                for _ in range(2)
+            ),
+            encoding="utf-8",
+        )
+
+        first, second = XEDParser().parse_file(isa_file)
+
+        assert first.iclass is second.iclass
+        assert first.category is second.category
+        assert first.extension is second.extension
+        assert first.isa_set is second.isa_set
+        assert first.attributes[0] is second.attributes[0]
+
+    def test_parse_operands(self):
+        """Test operand fields are split into name, type and access.
+
+        Operands without a colon, like REG1 here, are skipped.
+        """
+        operands = XEDParser()._parse_operands(
+            "REG0=GPR8_B():w MEM0=MEM:r:SUPP REG1=XED_REG_AL IMM0:r:b"
+        )
+
+        assert operands == [
+            {"name": "REG0", "type": "GPR8_B()", "access": "w"},
+            {"name": "MEM0", "type": "MEM:r", "access": "SUPP"},
+            {"name": "IMM0", "type": "b", "access": "r"},
+        ]
+
+    def test_parse_pattern(self):
+        """Test opcode bytes and encoding markers are extracted."""
+        encoding = XEDParser()._parse_pattern("0x0F 0xB6 MOD[mm] REG[rrr] RM[nnn]")
+
+        assert encoding["opcode"] == "0x0F 0xB6"
+        assert encoding["modrm"]
+        assert not encoding["sib"]
+        assert not encoding["immediate"]
+        assert not encoding["displacement"]
+        assert XEDParser()._parse_pattern("") == {}
+
+    def test_parse_pattern_immediates(self):
+        """Test every immediate token is recognized."""
+        parser = XEDParser()
+
+        for token in ["UIMM8()", "SIMM8()", "UIMM16()", "SIMM16()", "UIMM32()"]:
+            assert parser._parse_pattern(f"0xB8 {token}")["immediate"], token
+        assert parser._parse_pattern("0x05 SIMM32()")["immediate"]
+        assert parser._parse_pattern("0x05 SIMMz()")["immediate"]
+        assert not parser._parse_pattern("0xB8 UIMMz()")["immediate"]
+        assert not parser._parse_pattern("0xB8 UIMM8")["immediate"]
+
+    def test_parse_flags(self):
+        """Test only written flags are kept."""
+        flags = XEDParser()._parse_flags("MUST [ of-mod sf-u zf-w cf-set af-clr ]")
+
+        assert flags == ["OF", "ZF", "CF", "AF"]
+        assert XEDParser()._parse_flags("") == []